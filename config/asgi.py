@@ -0,0 +1,19 @@
+import os
+
+from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
+from django.core.asgi import get_asgi_application
+from django.conf import settings
+from django.views.static import serve
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ.setdefault("ASYNC_VIEWS", "true")  # route participant endpoints to recognition.async_views
+
+
+class StaticRootHandler(ASGIStaticFilesHandler):
+    """Serve collected files from STATIC_ROOT (WhiteNoise's job under WSGI; it is not async capable)."""
+
+    def serve(self, request):
+        return serve(request, self.file_path(request.path), document_root=settings.STATIC_ROOT)
+
+
+application = StaticRootHandler(get_asgi_application())
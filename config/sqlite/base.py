@@ -0,0 +1,18 @@
+"""
+SQLite backend for SQLITE_TUNING mode: applies settings.SQLITE_PRAGMAS (WAL, synchronous, busy timeout,
+mmap and cache size) to every new connection and opens transactions with BEGIN IMMEDIATE, so a writer
+takes the write lock up front (and waits on the busy timeout) instead of failing on lock upgrade.
+"""
+from django.conf import settings
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute("BEGIN IMMEDIATE")
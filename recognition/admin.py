@@ -1,13 +1,29 @@
 from django.contrib import admin
-from .models import MeetingSession, Nomination, Vote
+from . import counts
+from .models import MeetingSession, Nomination, NominatorQuota, NomineeTally, PendingVote, SessionArchive, SessionSummary, Vote
 
 
 @admin.register(MeetingSession)
 class MeetingSessionAdmin(admin.ModelAdmin):
-    list_display = ["title", "phase", "updated_at"]
+    list_display = ["title", "phase", "updated_at", "nominations", "nominators", "votes", "none_of_above_count"]
     list_filter = ["phase"]
     list_per_page = 20
 
+    def get_queryset(self, request):
+        return counts.with_counts(super().get_queryset(request))
+
+    @admin.display(ordering="nomination_count")
+    def nominations(self, obj):
+        return obj.nomination_count
+
+    @admin.display(ordering="nominator_count")
+    def nominators(self, obj):
+        return obj.nominator_count
+
+    @admin.display(ordering="vote_count")
+    def votes(self, obj):
+        return obj.vote_count
+
 
 @admin.register(Nomination)
 class NominationAdmin(admin.ModelAdmin):
@@ -16,8 +32,42 @@ class NominationAdmin(admin.ModelAdmin):
     list_per_page = 20
 
 
+@admin.register(NominatorQuota)
+class NominatorQuotaAdmin(admin.ModelAdmin):
+    list_display = ["nominator_name", "used", "session"]
+    list_filter = ["session"]
+    list_per_page = 20
+
+
 @admin.register(Vote)
 class VoteAdmin(admin.ModelAdmin):
     list_display = ["voter_name", "session", "created_at"]
     list_filter = ["session"]
     list_per_page = 20
+
+
+@admin.register(PendingVote)
+class PendingVoteAdmin(admin.ModelAdmin):
+    list_display = ["voter_name", "status", "session", "created_at"]
+    list_filter = ["status", "session"]
+    list_per_page = 20
+
+
+@admin.register(NomineeTally)
+class NomineeTallyAdmin(admin.ModelAdmin):
+    list_display = ["nominee_name", "votes", "session"]
+    list_filter = ["session"]
+    list_per_page = 20
+
+
+@admin.register(SessionArchive)
+class SessionArchiveAdmin(admin.ModelAdmin):
+    list_display = ["session", "created_at"]
+    list_per_page = 20
+
+
+@admin.register(SessionSummary)
+class SessionSummaryAdmin(admin.ModelAdmin):
+    list_display = ["session", "held_on", "created_at"]
+    date_hierarchy = "held_on"
+    list_per_page = 20
@@ -0,0 +1,49 @@
+"""Closing a session: summarize (and optionally snapshot) its results, then drop its raw rows with chunked DELETEs."""
+from django.conf import settings
+from django.db import connection, transaction
+
+from . import history, quota, tally
+from .models import Nomination, PendingVote, SessionArchive, Vote
+
+
+def _delete_ids(table, column, ids):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {connection.ops.quote_name(table)} WHERE {connection.ops.quote_name(column)} IN ({', '.join(['%s'] * len(ids))})",
+            ids,
+        )
+
+
+def purge_session(session, chunk_size=None):
+    """
+    Delete the session's votes, vote-nomination links and nominations chunk by chunk with raw SQL,
+    skipping Django's delete collector (which loads every row and cascades M2M rows in Python).
+    """
+    chunk_size = chunk_size or settings.RECOGNITION_DELETE_CHUNK_SIZE
+    through = Vote.nominations.through._meta.db_table
+    with transaction.atomic():
+        while ids := list(Vote.objects.filter(session=session).values_list("id", flat=True)[:chunk_size]):
+            _delete_ids(through, "vote_id", ids)
+            _delete_ids(Vote._meta.db_table, "id", ids)
+        while ids := list(Nomination.objects.filter(session=session).values_list("id", flat=True)[:chunk_size]):
+            _delete_ids(through, "nomination_id", ids)  # links from votes of other sessions, if any slipped in
+            _delete_ids(Nomination._meta.db_table, "id", ids)
+        PendingVote.objects.filter(session=session).delete()
+        tally.clear_tally(session)
+        quota.clear(session)
+
+
+def close_session(session, keep_results=False):
+    """
+    Write the session's history summary and drop its raw rows; with keep_results, also store the
+    full final results in a SessionArchive.
+    """
+    with transaction.atomic():
+        history.summarize(session)
+        if keep_results:
+            SessionArchive.objects.update_or_create(session=session, defaults={"results": tally.results_from_tally(session)})
+        purge_session(session)
+
+
+def archived_results(session):
+    return SessionArchive.objects.filter(session=session).values_list("results", flat=True).first()
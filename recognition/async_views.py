@@ -0,0 +1,126 @@
+"""
+Async variants of the participant-facing endpoints, routed in place of the sync ones when
+ASYNC_VIEWS is on (config/asgi.py turns it on). A slow or idle client then holds a coroutine
+instead of a whole worker. Lookups use the async ORM; cache access and the transactional
+writes reuse the sync helpers in views through sync_to_async. Streaming responses get async
+iterators: Django would read a sync one to the end before sending its first byte.
+"""
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from . import cache, events, views
+from .http import JsonResponse
+from .models import MeetingSession
+
+
+async def _resolve_session(request, session_id_from_body=None):
+    """Session from GET session_id, body session_id, or most recent."""
+    sid = request.GET.get("session_id") or session_id_from_body
+    if sid:
+        try:
+            return await MeetingSession.objects.aget(id=sid)
+        except (MeetingSession.DoesNotExist, ValueError):
+            return None
+    return await sync_to_async(cache.active_session)()
+
+
+@require_http_methods(["GET"])
+async def session_get(request):
+    sid = request.GET.get("session_id")
+    if sid:
+        try:
+            session = await MeetingSession.objects.aget(id=sid)
+        except (MeetingSession.DoesNotExist, ValueError):
+            return JsonResponse({"session": None, "error": "Session not found"})
+    else:
+        session = await sync_to_async(cache.active_session)(open_only=True)
+    return await sync_to_async(views._session_response)(request, session)
+
+
+@require_http_methods(["GET"])
+async def nominations_list(request):
+    session = await _resolve_session(request)
+    return await sync_to_async(views._nominations_response)(request, session)
+
+
+@require_http_methods(["GET"])
+async def nominations_grouped(request):
+    session = await _resolve_session(request)
+    return await sync_to_async(views._nominations_grouped_response)(request, session)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+async def nomination_create(request):
+    data = json.loads(request.body)
+    nominator_name, nominee_name, reason = data.get("nominator_name"), data.get("nominee_name"), data.get("reason")
+    if not all([nominator_name, nominee_name, reason]):
+        return JsonResponse({"error": "Missing fields"}, status=400)
+    session = await _resolve_session(request, data.get("session_id"))
+    return await sync_to_async(views._save_nomination)(session, nominator_name, nominee_name, reason)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+async def vote_create(request):
+    data = json.loads(request.body)
+    voter_name, nomination_ids = data.get("voter_name"), data.get("nomination_ids", [])
+    if not voter_name:
+        return JsonResponse({"error": "Voter name required"}, status=400)
+    session = await _resolve_session(request, data.get("session_id"))
+    return await sync_to_async(views._save_vote)(session, voter_name, nomination_ids)
+
+
+async def _event_stream(session_id, last_event_id):
+    """views._event_stream, waiting on the broker without holding a thread."""
+    broker = events.get_broker()
+    heartbeat = settings.SSE_HEARTBEAT_SECONDS
+    deadline = time.monotonic() + settings.SSE_MAX_STREAM_SECONDS
+    yield f"retry: {settings.SSE_RETRY_MS}\n\n"
+    seq = await sync_to_async(broker.current)(session_id)
+    while True:
+        frame, last_event_id = await sync_to_async(views._session_event)(session_id, last_event_id)
+        if frame:
+            yield frame
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            new_seq = await broker.wait_async(session_id, seq, min(heartbeat, remaining))
+            if new_seq != seq:
+                seq = new_seq
+                break
+            yield ": heartbeat\n\n"
+
+
+@require_http_methods(["GET"])
+async def session_stream(request):
+    sid = request.GET.get("session_id")
+    if sid:
+        session = await MeetingSession.objects.filter(id=sid).afirst() if sid.isdigit() else None
+    else:
+        session = await sync_to_async(cache.active_session)(open_only=True)
+    if not session:
+        return JsonResponse({"error": "Session not found"}, status=404)
+    return views._stream_response(_event_stream(session.pk, request.headers.get("Last-Event-ID")))
+
+
+async def _iterate_in_thread(iterator):
+    """Async iterator over a sync one whose steps query the database, one sync_to_async call per item."""
+    done = object()
+    while (item := await sync_to_async(next)(iterator, done)) is not done:
+        yield item
+
+
+@require_http_methods(["GET"])
+async def session_export(request, session_id, kind):
+    """views.session_export, its chunks pulled one at a time so memory stays flat under ASGI too."""
+    response = await sync_to_async(views.session_export)(request, session_id, kind)
+    if response.streaming:
+        response.streaming_content = _iterate_in_thread(iter(response.streaming_content))
+    return response
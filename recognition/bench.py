@@ -0,0 +1,144 @@
+"""Load-generation and reporting helpers shared by the bench_* management commands."""
+import itertools
+import json
+import threading
+import time
+from collections import defaultdict
+
+import requests
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+
+_addresses = itertools.count(1)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Recorder:
+    """Thread-safe per-endpoint latency, error and query-count collector."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.queries = defaultdict(int)
+
+    def record(self, name, seconds, ok=True, queries=0):
+        with self.lock:
+            self.latencies[name].append(seconds)
+            self.queries[name] += queries
+            if not ok:
+                self.errors[name] += 1
+
+    def rows(self, elapsed):
+        """One dict per endpoint: requests, req/s, p50/p95/p99 in ms, errors, queries per request."""
+        rows = []
+        for name in sorted(self.latencies):
+            values = sorted(self.latencies[name])
+            rows.append({
+                "endpoint": name,
+                "requests": len(values),
+                "rps": len(values) / elapsed if elapsed else 0.0,
+                "p50": percentile(values, 50) * 1000,
+                "p95": percentile(values, 95) * 1000,
+                "p99": percentile(values, 99) * 1000,
+                "errors": self.errors[name],
+                "queries": self.queries[name] / len(values) if values else 0.0,
+            })
+        return rows
+
+    def write_report(self, stdout, title, elapsed, show_queries=False):
+        stdout.write(f"\n{title}")
+        header = f"{'endpoint':<28}{'reqs':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+        stdout.write(header + (f"{'q/req':>8}" if show_queries else ""))
+        total = 0
+        for row in self.rows(elapsed):
+            total += row["requests"]
+            line = (
+                f"{row['endpoint']:<28}{row['requests']:>8}{row['rps']:>10.1f}{row['p50']:>10.2f}"
+                f"{row['p95']:>10.2f}{row['p99']:>10.2f}{row['errors']:>8}"
+            )
+            stdout.write(line + (f"{row['queries']:>8.1f}" if show_queries else ""))
+        stdout.write(f"{'total':<28}{total:>8}{total / elapsed if elapsed else 0:>10.1f}")
+
+
+def http_load(base_url, paths, clients, duration, recorder):
+    """`clients` threads GET `paths` round-robin from base_url for `duration` seconds; returns elapsed time."""
+    deadline = time.monotonic() + duration
+    base_url = base_url.rstrip("/")
+
+    def client(offset):
+        http = requests.Session()
+        i = offset
+        while time.monotonic() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            started = time.perf_counter()
+            try:
+                ok = http.get(base_url + path, timeout=30).status_code < 400
+            except requests.RequestException:
+                ok = False
+            recorder.record(path.split("?")[0], time.perf_counter() - started, ok)
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=client, args=(n,), daemon=True) for n in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.monotonic() - started
+
+
+class InProcessClient:
+    """Requests through the URL routes in this process (django.test.Client), recording queries per request."""
+
+    def __init__(self, recorder, admin_password):
+        self.recorder = recorder
+        self.admin_password = admin_password
+        host = next((h for h in settings.ALLOWED_HOSTS if h not in ("*", "") and not h.startswith(".")), "localhost")
+        n = next(_addresses)  # one address per simulated device, as the per-IP rate limit expects
+        self.client = Client(HTTP_HOST=host, REMOTE_ADDR=f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}")
+
+    def request(self, method, path, data=None, admin=False):
+        """(status, JSON body or None); `data` is the query string for GET and the JSON body otherwise."""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {self.admin_password}"} if admin else {}
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            if method == "GET":
+                r = self.client.get(path, data, **headers)
+            else:
+                r = self.client.generic(method, path, json.dumps(data or {}), content_type="application/json", **headers)
+        self.recorder.record(path, time.perf_counter() - started, r.status_code < 400, len(queries))
+        return r.status_code, r.json() if r.get("Content-Type") == "application/json" else None
+
+
+class HttpClient:
+    """Same interface as InProcessClient against a running server; query counts are not visible from here."""
+
+    def __init__(self, recorder, admin_password, base_url):
+        self.recorder = recorder
+        self.admin_password = admin_password
+        self.base_url = base_url.rstrip("/")
+        self.http = requests.Session()
+
+    def request(self, method, path, data=None, admin=False):
+        headers = {"Authorization": f"Bearer {self.admin_password}"} if admin else {}
+        started = time.perf_counter()
+        try:
+            if method == "GET":
+                r = self.http.get(self.base_url + path, params=data, headers=headers, timeout=30)
+            else:
+                r = self.http.request(method, self.base_url + path, json=data or {}, headers=headers, timeout=30)
+        except requests.RequestException:
+            self.recorder.record(path, time.perf_counter() - started, False)
+            return None, None
+        self.recorder.record(path, time.perf_counter() - started, r.status_code < 400)
+        return r.status_code, r.json() if r.headers.get("Content-Type") == "application/json" else None
@@ -0,0 +1,82 @@
+"""
+Batch ingestion for kiosk / paper-ballot collection: validate every record in memory against one
+prefetch of the session's existing rows, then insert the valid ones with bulk_create.
+Errors are reported per record as {"index": i, "error": message}; valid records still go in.
+"""
+from django.db import IntegrityError, transaction
+
+from . import cache, quota, tally
+from .models import Nomination, Vote, normalize_nominee
+
+
+def ingest_votes(session, records):
+    """Insert valid vote records ({voter_name, nomination_ids}); returns (created, errors)."""
+    voters = set(Vote.objects.filter(session=session).values_list("voter_name", flat=True))
+    nominations = {n.id: n for n in Nomination.objects.filter(session=session).only("id", "nominee_name", "nominee_key")}
+    errors, valid = [], []
+    for i, rec in enumerate(records):
+        rec = rec if isinstance(rec, dict) else {}
+        voter_name, ids = rec.get("voter_name"), rec.get("nomination_ids") or []
+        if not voter_name or not isinstance(voter_name, str):
+            errors.append({"index": i, "error": "Voter name required"})
+        elif voter_name in voters:
+            errors.append({"index": i, "error": "You have already voted"})
+        elif not isinstance(ids, list) or len(ids) > 3:
+            errors.append({"index": i, "error": "You can select up to 3 candidates."})
+        elif any(not isinstance(nid, int) or nid not in nominations for nid in ids):
+            errors.append({"index": i, "error": "Unknown nomination id"})
+        else:
+            voters.add(voter_name)
+            valid.append((voter_name, [nominations[nid] for nid in dict.fromkeys(ids)]))
+    if not valid:
+        return 0, errors
+    insert_votes(session, valid)
+    return len(valid), errors
+
+
+def insert_votes(session, ballots):
+    """Insert (voter_name, [Nomination, ...]) ballots, their links and tally counts in one transaction; returns the Votes."""
+    Through = Vote.nominations.through
+    with transaction.atomic():
+        votes = Vote.objects.bulk_create(Vote(session=session, voter_name=voter_name) for voter_name, _ in ballots)
+        Through.objects.bulk_create(
+            Through(vote_id=vote.id, nomination_id=n.id) for vote, (_, chosen) in zip(votes, ballots) for n in chosen
+        )
+        tally.record_votes(session, [chosen for _, chosen in ballots])
+        cache.bump_versions(session, "votes_version")
+    return votes
+
+
+def ingest_nominations(session, records):
+    """Insert valid nomination records ({nominator_name, nominee_name, reason}); returns (created, errors)."""
+    taken = set()
+    per_nominator = {}
+    for nominator_name, nominee_key in Nomination.objects.filter(session=session).values_list("nominator_name", "nominee_key"):
+        taken.add((nominator_name, nominee_key))
+        per_nominator[nominator_name] = per_nominator.get(nominator_name, 0) + 1
+    errors, valid = [], []
+    for i, rec in enumerate(records):
+        rec = rec if isinstance(rec, dict) else {}
+        nominator_name, nominee_name, reason = rec.get("nominator_name"), rec.get("nominee_name"), rec.get("reason")
+        if not all(isinstance(v, str) and v for v in (nominator_name, nominee_name, reason)):
+            errors.append({"index": i, "error": "Missing fields"})
+            continue
+        key = normalize_nominee(nominee_name)
+        if (nominator_name, key) in taken:
+            errors.append({"index": i, "error": "You can nominate each person at most once."})
+        elif per_nominator.get(nominator_name, 0) >= quota.MAX_NOMINATIONS:
+            errors.append({"index": i, "error": "You can nominate at most 3 people per session."})
+        else:
+            taken.add((nominator_name, key))
+            per_nominator[nominator_name] = per_nominator.get(nominator_name, 0) + 1
+            valid.append(
+                Nomination(session=session, nominator_name=nominator_name, nominee_name=nominee_name, nominee_key=key, reason=reason)
+            )
+    if not valid:
+        return 0, errors
+    with transaction.atomic():
+        Nomination.objects.bulk_create(valid)
+        if quota.sync(session, {n.nominator_name for n in valid}):
+            raise IntegrityError("nomination cap exceeded by concurrent nominations")
+        cache.bump_versions(session, "nominations_version")
+    return len(valid), errors
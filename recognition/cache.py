@@ -0,0 +1,67 @@
+"""
+Per-session payload cache. Keys embed the session's version counters, so the writes that bump
+nominations_version / votes_version / updated_at invalidate by making old keys unreachable;
+stale entries age out through the cache backend's TIMEOUT and MAX_ENTRIES culling.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F, Subquery
+
+from .models import ActiveSession, MeetingSession, newest_session
+
+
+def version_tag(session, kind):
+    """Identifies one version of a session payload; doubles as the ETag value."""
+    tag = f"{kind}-{session.pk}-{session.created_at.timestamp():.6f}"
+    if kind == "session":
+        tag += f"-{session.updated_at.timestamp():.6f}"
+        if (session.phase or "").lower() not in ("results", "closed"):
+            return tag
+    tag += f"-{session.nominations_version}"
+    if kind != "nominations":
+        tag += f"-{session.votes_version}"
+    return tag
+
+
+def bump_versions(session, *fields):
+    """Increment nominations_version / votes_version, retiring cached payloads and ETags."""
+    MeetingSession.objects.filter(pk=session.pk).update(**{f: F(f) + 1 for f in fields})
+
+
+# Part of every payload key; bump it when the shape of a cached payload changes.
+PAYLOAD_FORMAT = 3
+
+
+def get_cache():
+    return caches[getattr(settings, "RECOGNITION_CACHE", "default")]
+
+
+def cached(kind, session, build, variant=None):
+    """
+    Return the cached payload for this session version, building and storing it on a miss.
+    `variant` tells apart representations of the same version (e.g. a query string).
+    """
+    cache = get_cache()
+    key = f"recognition:{PAYLOAD_FORMAT}:{version_tag(session, kind)}"
+    if variant:
+        key += ":" + hashlib.sha1(variant.encode()).hexdigest()[:16]
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value)
+    return value
+
+
+def active_session(open_only=False):
+    """
+    Most recently updated session (open_only: excluding closed ones) through the ActiveSession
+    pointer row, in one primary-key read joined to it. With no pointer (a fresh table, or its session
+    was deleted) the ordered query answers instead.
+    """
+    pointer = ActiveSession.objects.filter(pk=1).values("latest_open_id" if open_only else "latest_id")
+    session = next(iter(MeetingSession.objects.filter(pk=Subquery(pointer))), None)
+    if session and not (open_only and session.phase == "closed"):
+        return session
+    return newest_session(open_only)
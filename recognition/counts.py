@@ -0,0 +1,23 @@
+"""Per-session row counts for session listings, as correlated subqueries on the listing's own query."""
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Nomination, Vote
+
+
+def _count(model, closed, field="pk", distinct=False):
+    rows = model.objects.filter(session=OuterRef("pk")).order_by().values("session")
+    return Coalesce(Subquery(rows.annotate(n=Count(field, distinct=distinct)).values("n")), F(f"summary__{closed}"), 0, output_field=IntegerField())
+
+
+def with_counts(sessions):
+    """
+    Annotate nomination_count, nominator_count and vote_count; each is an index-only count per
+    returned session, so a page of sessions stays one query. Closed sessions, whose rows are purged,
+    report the counts their SessionSummary recorded at close.
+    """
+    return sessions.annotate(
+        nomination_count=_count(Nomination, "nomination_count"),
+        nominator_count=_count(Nomination, "nominator_count", "nominator_name", distinct=True),
+        vote_count=_count(Vote, "vote_count"),
+    )
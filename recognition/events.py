@@ -0,0 +1,134 @@
+"""Session change notifications that wake /api/session/stream listeners."""
+import asyncio
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+
+class InProcessBroker:
+    """Condition-variable fan-out; only reaches streams served by the same process."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._seq = {}
+        self._async_waiters = {}  # session_id -> {(event loop, asyncio.Event)}
+
+    def publish(self, session_id):
+        with self._cond:
+            self._seq[session_id] = self._seq.get(session_id, 0) + 1
+            self._cond.notify_all()
+            waiters = list(self._async_waiters.get(session_id, ()))
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # that loop has shut down
+                pass
+
+    def current(self, session_id):
+        with self._cond:
+            return self._seq.get(session_id, 0)
+
+    def wait(self, session_id, last_seq, timeout):
+        """Block until the session's sequence moves past last_seq or timeout expires; return the sequence."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq.get(session_id, 0) != last_seq, timeout)
+            return self._seq.get(session_id, 0)
+
+    async def wait_async(self, session_id, last_seq, timeout):
+        """wait() for async streams: suspends the coroutine instead of blocking a thread."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            if self._seq.get(session_id, 0) != last_seq:
+                return self._seq[session_id]
+            self._async_waiters.setdefault(session_id, set()).add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                waiters = self._async_waiters.get(session_id, set())
+                waiters.discard(waiter)
+                if not waiters:
+                    self._async_waiters.pop(session_id, None)
+        return self.current(session_id)
+
+
+class CacheBroker:
+    """Change counters kept in the Django cache so every worker sees them; needs a shared cache backend."""
+    poll_interval = 0.5
+
+    def __init__(self, alias="default"):
+        self.cache = caches[alias]
+
+    def _key(self, session_id):
+        return f"recognition:events:{session_id}"
+
+    def publish(self, session_id):
+        key = self._key(session_id)
+        self.cache.add(key, 0, timeout=None)
+        try:
+            self.cache.incr(key)
+        except ValueError:  # evicted between add and incr
+            self.cache.set(key, 1, timeout=None)
+
+    def current(self, session_id):
+        return self.cache.get(self._key(session_id), 0)
+
+    def wait(self, session_id, last_seq, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            seq = self.current(session_id)
+            remaining = deadline - time.monotonic()
+            if seq != last_seq or remaining <= 0:
+                return seq
+            time.sleep(min(self.poll_interval, remaining))
+
+    async def wait_async(self, session_id, last_seq, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            seq = await sync_to_async(self.current)(session_id)
+            remaining = deadline - time.monotonic()
+            if seq != last_seq or remaining <= 0:
+                return seq
+            await asyncio.sleep(min(self.poll_interval, remaining))
+
+
+_brokers = {}
+_brokers_lock = threading.Lock()
+
+
+def get_broker():
+    path = getattr(settings, "SSE_BROKER", "recognition.events.InProcessBroker")
+    with _brokers_lock:
+        if path not in _brokers:
+            _brokers[path] = import_string(path)()
+        return _brokers[path]
+
+
+def publish(session_id):
+    get_broker().publish(session_id)
+
+
+_open_streams = set()
+_streams_lock = threading.Lock()
+
+
+def open_stream():
+    """Claim one of this process's SSE_MAX_STREAMS stream slots: a token for close_stream(), None when all are taken."""
+    with _streams_lock:
+        if len(_open_streams) >= settings.SSE_MAX_STREAMS:
+            return None
+        slot = object()
+        _open_streams.add(slot)
+        return slot
+
+
+def close_stream(slot):
+    """Free a slot from open_stream(); freeing it again is a no-op."""
+    with _streams_lock:
+        _open_streams.discard(slot)
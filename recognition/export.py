@@ -0,0 +1,82 @@
+"""
+Streaming exports of a session's nominations, votes and results as CSV or NDJSON. Rows come from
+.values_list().iterator(chunk_size=RECOGNITION_EXPORT_CHUNK_SIZE) and leave as text chunks of
+about that many rows, so memory stays flat whatever the session size.
+"""
+import csv
+import itertools
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Vote
+
+FORMATS = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def nomination_rows(session):
+    yield ("id", "nominator_name", "nominee_name", "reason", "created_at")
+    yield from (
+        session.nominations.order_by("nominee_key", "id")
+        .values_list("id", "nominator_name", "nominee_name", "reason", "created_at")
+        .iterator(chunk_size=settings.RECOGNITION_EXPORT_CHUNK_SIZE)
+    )
+
+
+def vote_rows(session):
+    """One row per vote with its nominees (none = none of the above), from one LEFT JOIN read in vote order."""
+    yield ("id", "voter_name", "nomination_ids", "nominee_names", "created_at")
+    links = (
+        Vote.objects.filter(session=session)
+        .order_by("id", "nominations__id")
+        .values_list("id", "voter_name", "created_at", "nominations__id", "nominations__nominee_name")
+        .iterator(chunk_size=settings.RECOGNITION_EXPORT_CHUNK_SIZE)
+    )
+    for (vote_id, voter_name, created_at), rows in itertools.groupby(links, key=lambda r: r[:3]):
+        chosen = [(nid, name) for *_, nid, name in rows if nid is not None]
+        yield vote_id, voter_name, [nid for nid, _ in chosen], [name for _, name in chosen], created_at
+
+
+def result_rows(results):
+    """Rows of a results payload (as _get_results_for_session returns it); none of the above has no nominee name."""
+    yield ("nominee_name", "votes", "winner")
+    winners = set(results["winners"])
+    for row in results["vote_counts"]:
+        yield row["name"], row["count"], row["name"] in winners
+    yield None, results["none_of_above_count"], False
+
+
+class _Line:
+    """File-like target for csv.writer that hands back what was written."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if isinstance(value, list):
+        value = "; ".join(map(str, value))
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+        return "'" + value  # keep spreadsheets from evaluating user text as a formula
+    return value
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Line())
+    for row in rows:
+        yield writer.writerow([_csv_value(v) for v in row])
+
+
+def _ndjson_lines(rows):
+    rows = iter(rows)
+    header = next(rows)
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(header, row))) + "\n"
+
+
+def stream(rows, fmt):
+    """Encode rows (a header tuple first) as CSV or NDJSON, yielding chunks of RECOGNITION_EXPORT_CHUNK_SIZE lines."""
+    lines = _csv_lines(rows) if fmt == "csv" else _ndjson_lines(rows)
+    while chunk := "".join(itertools.islice(lines, settings.RECOGNITION_EXPORT_CHUNK_SIZE)):
+        yield chunk.encode()
@@ -0,0 +1,52 @@
+"""Nominations grouped by normalized nominee for the voting screen, built by one aggregate query."""
+from django.db.models import Aggregate, Count, JSONField, Min
+from django.db.models.functions import Substr, Trim
+
+# Reasons are cut to this many characters in the grouped payload; the full text is in /api/nominations.
+REASON_PREVIEW = 140
+
+
+class JSONGroupArray(Aggregate):
+    """JSON array of [expr1, expr2, ...] per group (JSON_GROUP_ARRAY / JSONB_AGG / JSON_ARRAYAGG)."""
+
+    function = "JSON_GROUP_ARRAY"
+    template = "%(function)s(JSON_ARRAY(%(expressions)s))"
+    output_field = JSONField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        # jsonb, not json: Django reads jsonb columns as text for JSONField to decode, while psycopg2
+        # hands back json values already decoded, which JSONField.from_db_value then fails on.
+        return self.as_sql(
+            compiler, connection, function="JSONB_AGG", template="%(function)s(JSONB_BUILD_ARRAY(%(expressions)s))",
+            **extra_context,
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function="JSON_ARRAYAGG", **extra_context)
+
+
+def grouped_nominations(session):
+    """
+    One entry per nominee key, ordered by key: display name, nomination ids and their reasons
+    (truncated to REASON_PREVIEW, in id order) and the number of distinct nominators.
+    """
+    rows = (
+        session.nominations.values("nominee_key")
+        .annotate(
+            name=Min(Trim("nominee_name")),
+            nominators=Count("nominator_name", distinct=True),
+            items=JSONGroupArray("id", Substr("reason", 1, REASON_PREVIEW)),
+        )
+        .order_by("nominee_key")
+    )
+    nominees = []
+    for row in rows:
+        items = sorted(row["items"])  # aggregate order is unspecified
+        nominees.append({
+            "nominee_key": row["nominee_key"],
+            "nominee_name": row["name"],
+            "nomination_ids": [pk for pk, _ in items],
+            "reasons": [reason for _, reason in items],
+            "nominator_count": row["nominators"],
+        })
+    return nominees
@@ -0,0 +1,97 @@
+"""
+Recognition history across sessions. Closing a session writes a SessionSummary (winners and top
+nominees by key), so history and the leaderboard read O(sessions) small rows long after the
+votes themselves are purged.
+"""
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from . import cache, counts, http
+from .models import MeetingSession, NomineeTally, SessionSummary
+
+
+def summarize(session):
+    """Write the session's SessionSummary from its tally and row counts; call before close purges them."""
+    rows = [
+        {"key": key, "name": name, "count": votes}
+        for key, name, votes in NomineeTally.objects.filter(session=session, votes__gt=0)
+        .order_by("-votes", "id")
+        .values_list("nominee_key", "nominee_name", "votes")
+    ]
+    best = rows[0]["count"] if rows else 0
+    closing = counts.with_counts(MeetingSession.objects.filter(pk=session.pk)).values("nomination_count", "nominator_count", "vote_count")
+    closing = closing.get()
+    SessionSummary.objects.filter(session=session).delete()  # replaced, never updated: see history_version
+    SessionSummary.objects.create(
+        session=session,
+        held_on=session.meeting_date or timezone.localdate(),
+        winners=[r for r in rows if r["count"] == best],
+        top=rows[: settings.RECOGNITION_SUMMARY_TOP_N],
+        none_of_above_count=session.none_of_above_count,
+        **closing,
+    )
+
+
+def summary_results(session):
+    """
+    Results payload (the shape the archive keeps) rebuilt from the session's summary: its
+    RECOGNITION_SUMMARY_TOP_N nominees plus any tied winners beyond them. None without a summary.
+    """
+    summary = SessionSummary.objects.filter(session=session).values("winners", "top", "none_of_above_count").first()
+    if not summary:
+        return None
+    listed = {row["key"] for row in summary["top"]}
+    rows = summary["top"] + [w for w in summary["winners"] if w["key"] not in listed]
+    return {
+        "vote_counts": [{"name": row["name"], "count": row["count"]} for row in rows],
+        "winners": [w["name"] for w in summary["winners"]],
+        "none_of_above_count": summary["none_of_above_count"],
+    }
+
+
+def build_history(start=None, end=None):
+    """
+    Sessions held between start and end (dates, inclusive; None = open), newest first, and a
+    leaderboard by nominee key: sessions won, votes while in a session's top
+    RECOGNITION_SUMMARY_TOP_N, and sessions placed in it.
+    """
+    summaries = SessionSummary.objects.order_by("-held_on", "-session_id")
+    if start:
+        summaries = summaries.filter(held_on__gte=start)
+    if end:
+        summaries = summaries.filter(held_on__lte=end)
+    sessions, board = [], {}
+    for session_id, title, held_on, winners, top in summaries.values_list("session_id", "session__title", "held_on", "winners", "top"):
+        sessions.append({"id": str(session_id), "title": title, "held_on": held_on, "winners": [w["name"] for w in winners]})
+        for row in top:
+            entry = board.setdefault(row["key"], {"nominee_name": row["name"], "wins": 0, "votes": 0, "sessions": 0})
+            entry["votes"] += row["count"]
+            entry["sessions"] += 1
+        for w in winners:
+            board.setdefault(w["key"], {"nominee_name": w["name"], "wins": 0, "votes": 0, "sessions": 0})["wins"] += 1
+    leaderboard = sorted(
+        ({"nominee_key": key, **entry} for key, entry in board.items()),
+        key=lambda e: (-e["wins"], -e["votes"], e["nominee_key"]),
+    )
+    return {"sessions": sessions, "leaderboard": leaderboard}
+
+
+def history_version():
+    """
+    Version of the set of session summaries, read from the table so every worker agrees on it.
+    Summaries are only ever inserted or deleted, so their count and highest id change with each write.
+    """
+    row = SessionSummary.objects.aggregate(n=Count("id"), last=Max("id"))
+    return f"{row['n']}-{row['last']}"
+
+
+def history_payload(start=None, end=None):
+    """Encoded build_history(start, end), cached until the next session closes."""
+    store = cache.get_cache()
+    key = f"recognition:{cache.PAYLOAD_FORMAT}:history-{history_version()}:{start}:{end}"
+    payload = store.get(key)
+    if payload is None:
+        payload = http.dumps(build_history(start, end))
+        store.set(key, payload)
+    return payload
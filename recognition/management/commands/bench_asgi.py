@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from recognition.bench import Recorder, http_load
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare concurrent polling throughput of the sync (WSGI) and async (ASGI) stacks. Start both first, e.g.\n"
+        "  gunicorn config.wsgi:application -w 3 -b 127.0.0.1:8000\n"
+        "  gunicorn config.asgi:application -w 3 -k uvicorn.workers.UvicornWorker -b 127.0.0.1:8001\n"
+        "then run: manage.py bench_asgi --clients 200 --duration 15"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sync-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--async-url", default="http://127.0.0.1:8001")
+        parser.add_argument("--clients", type=int, default=100, help="Concurrent polling clients")
+        parser.add_argument("--duration", type=float, default=10.0, help="Seconds per stack")
+        parser.add_argument("--session-id", help="Poll this session instead of the active one")
+
+    def handle(self, *args, **options):
+        query = f"?session_id={options['session_id']}" if options["session_id"] else ""
+        paths = [f"/api/session{query}", f"/api/nominations{query}"]
+        for label, url in (("sync (WSGI)", options["sync_url"]), ("async (ASGI)", options["async_url"])):
+            recorder = Recorder()
+            elapsed = http_load(url, paths, options["clients"], options["duration"], recorder)
+            recorder.write_report(self.stdout, f"{label} {url}: {options['clients']} clients, {elapsed:.1f}s", elapsed)
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+from django.test import RequestFactory
+
+from recognition import views
+from recognition.bench import Recorder
+from recognition.models import MeetingSession
+
+
+class Command(BaseCommand):
+    help = (
+        "Per-request latency of GET /api/session with a fresh connection per request vs. a persistent "
+        "connection, against the configured database (point DATABASE_URL at a local Postgres to measure "
+        "connection setup there; the bundled SQLite file is the stand-in otherwise). Read-only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500)
+
+    def handle(self, *args, **options):
+        session = MeetingSession.objects.order_by("-updated_at").first()
+        params = {"session_id": session.pk} if session else {}
+        factory = RequestFactory()
+        modes = [("CONN_MAX_AGE=0", 0), ("CONN_MAX_AGE=600", 600)]
+        if connection.settings_dict.get("OPTIONS", {}).get("pool"):
+            modes = [("DB_POOL", 0)]
+        configured = connection.settings_dict["CONN_MAX_AGE"]
+        self.stdout.write(f"{connection.vendor} ({connection.settings_dict['NAME']}), {options['requests']} requests per mode")
+        try:
+            for label, max_age in modes:
+                connection.close()
+                connection.settings_dict["CONN_MAX_AGE"] = max_age
+                recorder = Recorder()
+                started = time.perf_counter()
+                for _ in range(options["requests"]):
+                    t0 = time.perf_counter()
+                    close_old_connections()  # what the handler does on request_started...
+                    views.session_get(factory.get("/api/session", params))
+                    close_old_connections()  # ...and on request_finished
+                    recorder.record(label, time.perf_counter() - t0)
+                recorder.write_report(self.stdout, "", time.perf_counter() - started)
+        finally:
+            connection.close()
+            connection.settings_dict["CONN_MAX_AGE"] = configured
@@ -0,0 +1,75 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.http import JsonResponse as DjangoJsonResponse
+from django.test import RequestFactory, override_settings
+
+from recognition import http, views
+from recognition.models import MeetingSession, Nomination
+
+
+class Command(BaseCommand):
+    help = (
+        "Micro-benchmark of nominations_list payload encoding for --rows nominations: Django's JsonResponse "
+        "over per-row dicts (the previous path) vs. the stdlib/orjson encoders and RowEncoder over "
+        ".values_list() tuples. --db also times the view against rows inserted in a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--db", action="store_true")
+
+    def handle(self, *args, **options):
+        fields = views.NOMINATION_ROWS.fields
+        rows = [
+            (i, f"Nominator {i}", f"Nominee {i % 50} ü", f"Shipped the launch on time, reviewed {i} PRs — \"great\".")
+            for i in range(options["rows"])
+        ]
+        encoders = ["stdlib"] + (["orjson"] if http.orjson is not None else [])
+        cases = [("dicts + django JsonResponse", lambda: DjangoJsonResponse({"nominations": [dict(zip(fields, r)) for r in rows]}))]
+        for encoder in encoders:
+            cases.append((f"dicts + {encoder}", lambda e=encoder: self.response(e, lambda: {"nominations": [dict(zip(fields, r)) for r in rows]})))
+            cases.append((f"RowEncoder + {encoder}", lambda e=encoder: self.response(
+                e, lambda: http.RawJSON(b'{"nominations": %s}' % views.NOMINATION_ROWS.encode(rows))
+            )))
+        self.stdout.write(f"{options['rows']} nominations, best / median of {options['repeat']} (orjson {'available' if http.orjson else 'not installed'})")
+        for label, build in cases:
+            self.report(label, build, options["repeat"])
+        if options["db"]:
+            self.bench_view(options)
+
+    def response(self, encoder, payload):
+        with override_settings(RECOGNITION_JSON_ENCODER=encoder):
+            return http.JsonResponse(payload())
+
+    def report(self, label, build, repeat):
+        timings, size = [], 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            size = len(build().content)
+            timings.append((time.perf_counter() - started) * 1000)
+        self.stdout.write(f"  {label:<36}{min(timings):>9.2f} ms{statistics.median(timings):>9.2f} ms{size:>11} bytes")
+
+    def bench_view(self, options):
+        request = RequestFactory().get("/api/nominations")
+        with transaction.atomic():
+            session = MeetingSession.objects.create(title="bench_json", phase="voting")
+            Nomination.objects.bulk_create(
+                (
+                    Nomination(session=session, nominator_name=f"N{i}", nominee_name=f"P{i}", nominee_key=f"p{i}", reason="R" * 80)
+                    for i in range(options["rows"])
+                ),
+                batch_size=2000,
+            )
+            self.stdout.write("nominations_list view")
+
+            def cold():
+                session.nominations_version += 1  # a key nothing has cached yet
+                return views._nominations_response(request, session)
+
+            self.report("cache miss (query + encode)", cold, options["repeat"])
+            self.report("cache hit", lambda: views._nominations_response(request, session), options["repeat"])
+            transaction.set_rollback(True)
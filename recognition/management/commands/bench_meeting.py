@@ -0,0 +1,125 @@
+import queue
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from recognition.bench import HttpClient, InProcessClient, Recorder
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate a full meeting against the API routes: create a session, then N participants poll it "
+        "through nomination, voting and results while they nominate and vote, then close it. Reports req/s "
+        "and p50/p95/p99 per endpoint for each phase (plus queries per request in-process).\n"
+        "In-process (default) runs against the configured database; --base-url targets a running server. "
+        "Either way the session and its rows are real; it is closed (raw rows purged) at the end unless --keep. "
+        "Against a server every participant shares this machine's address: raise its RATE_LIMIT_IP (or set "
+        "RATE_LIMIT=false) so the per-IP limit does not reject the run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--participants", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=50, help="Participants acting at once")
+        parser.add_argument("--polls", type=int, default=3, help="GET /api/session polls per participant per phase")
+        parser.add_argument("--nominees", type=int, default=10, help="Distinct people nominated")
+        parser.add_argument("--base-url", help="e.g. http://127.0.0.1:8000; default: in-process")
+        parser.add_argument("--admin-password", default=settings.ADMIN_PASSWORD)
+        parser.add_argument("--keep", action="store_true", help="Leave the session in the results phase")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        self.options = options
+        base_url = options["base_url"]
+        where = base_url or f"in-process, {connection.vendor} ({connection.settings_dict['NAME']})"
+        self.stdout.write(
+            f"{options['participants']} participants, concurrency {options['concurrency']}, "
+            f"{options['polls']} polls per phase, {where}"
+        )
+        admin = self.client(Recorder())
+        status, body = admin.request("POST", "/api/session/create", {"title": "bench_meeting"}, admin=True)
+        if status != 201:
+            raise CommandError(f"session/create failed ({status}); check --admin-password / --base-url")
+        self.sid = body["session"]["id"]
+        totals = [0, 0.0]
+
+        def phase(title, name, task):
+            recorder = Recorder()
+            self.patch(recorder, name)
+            elapsed = self.run_participants(recorder, task)
+            recorder.write_report(self.stdout, f"{title}: {elapsed:.2f}s", elapsed, show_queries=not base_url)
+            totals[0] += sum(row["requests"] for row in recorder.rows(elapsed))
+            totals[1] += elapsed
+
+        phase("Nomination", "nomination", self.nominate)
+        phase("Voting", "voting", self.vote)
+        phase("Results", "results", self.poll)
+        if not options["keep"]:
+            recorder = Recorder()
+            started = time.perf_counter()
+            self.patch(recorder, "closed")
+            elapsed = time.perf_counter() - started
+            recorder.write_report(self.stdout, f"Close: {elapsed:.2f}s", elapsed, show_queries=not base_url)
+        self.stdout.write(f"\nsession {self.sid}: {totals[0]} requests in {totals[1]:.2f}s")
+
+    def client(self, recorder):
+        if self.options["base_url"]:
+            return HttpClient(recorder, self.options["admin_password"], self.options["base_url"])
+        return InProcessClient(recorder, self.options["admin_password"])
+
+    def patch(self, recorder, phase):
+        status, body = self.client(recorder).request(
+            "PATCH", "/api/session/patch", {"session_id": self.sid, "phase": phase}, admin=True
+        )
+        if status != 200:
+            raise CommandError(f"moving the session to {phase} failed ({status}): {body}")
+
+    def run_participants(self, recorder, task):
+        """Run task(client, i) for every participant on --concurrency threads; returns elapsed seconds."""
+        todo = queue.SimpleQueue()
+        for i in range(self.options["participants"]):
+            todo.put(i)
+
+        def worker():
+            client = self.client(recorder)
+            try:
+                while True:
+                    try:
+                        i = todo.get_nowait()
+                    except queue.Empty:
+                        return
+                    task(client, i)
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.options["concurrency"])]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return time.perf_counter() - started
+
+    def poll(self, client, i):
+        for _ in range(self.options["polls"]):
+            client.request("GET", "/api/session", {"session_id": self.sid})
+
+    def nominate(self, client, i):
+        self.poll(client, i)
+        client.request("POST", "/api/nominations/create", {
+            "session_id": self.sid,
+            "nominator_name": f"Participant {i}",
+            "nominee_name": f"Nominee {i % self.options['nominees']}",
+            "reason": "Shipped the thing.",
+        })
+
+    def vote(self, client, i):
+        self.poll(client, i)
+        _, body = client.request("GET", "/api/nominations", {"session_id": self.sid})
+        ids = [n["id"] for n in (body or {}).get("nominations", [])]
+        rng = random.Random(self.options["seed"] * 1_000_003 + i)
+        chosen = rng.sample(ids, min(len(ids), rng.randint(0, 3)))  # 0 = none of the above
+        client.request("POST", "/api/votes/create", {"session_id": self.sid, "voter_name": f"Participant {i}", "nomination_ids": chosen})
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from recognition import votequeue
+
+
+class Command(BaseCommand):
+    help = (
+        "Record votes queued by vote_create in VOTE_QUEUE mode. Flushes once by default; --loop keeps "
+        "flushing every --interval seconds, for running the flusher as its own process (VOTE_QUEUE_THREAD=false)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--session", type=int, help="Only this session's queue")
+        parser.add_argument("--loop", action="store_true")
+        parser.add_argument("--interval", type=float, default=0.5)
+
+    def handle(self, *args, **options):
+        while True:
+            processed = votequeue.flush(options["session"])
+            if processed or not options["loop"]:
+                self.stdout.write(f"{processed} queued votes processed")
+            if not options["loop"]:
+                return
+            close_old_connections()
+            time.sleep(options["interval"])
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from recognition.models import MeetingSession
+from recognition.tally import rebuild_tally
+
+
+class Command(BaseCommand):
+    help = "Recompute NomineeTally rows and none-of-the-above counts from the raw Vote rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--session", type=int, help="Only rebuild this session id (default: all sessions)")
+
+    def handle(self, *args, **options):
+        sessions = MeetingSession.objects.all()
+        if options["session"]:
+            sessions = sessions.filter(id=options["session"])
+            if not sessions.exists():
+                raise CommandError(f"Session {options['session']} not found")
+        for session in sessions.iterator():
+            rebuild_tally(session)
+            self.stdout.write(f"Rebuilt tally for session {session.id}")
@@ -0,0 +1,99 @@
+"""
+Per-view request metrics collected by recognition.middleware.ProfilingMiddleware and served in the
+Prometheus text format at /api/metrics. The registry lives in process memory, so with several
+gunicorn workers each scrape sees the worker that answered it (scrape workers individually or
+aggregate over the `instance` label).
+"""
+import threading
+from contextvars import ContextVar
+
+# Seconds spent encoding JSON responses in the current request; see recognition.http.JsonResponse.
+_serialize_seconds = ContextVar("serialize_seconds", default=None)
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+def start_request():
+    """Begin accumulating serialization time for this request (context); returns a token for end_request."""
+    return _serialize_seconds.set([0.0])
+
+
+def end_request(token):
+    """Serialization seconds accumulated since start_request."""
+    total = _serialize_seconds.get()[0]
+    _serialize_seconds.reset(token)
+    return total
+
+
+def add_serialization(seconds):
+    acc = _serialize_seconds.get()
+    if acc is not None:
+        acc[0] += seconds
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a view label, rendered as a Prometheus histogram."""
+
+    def __init__(self, name, help_text, buckets):
+        self.name, self.help_text, self.buckets = name, help_text, buckets
+        self.series = {}  # view -> [count per bucket..., +Inf count, sum]
+
+    def observe(self, view, value):
+        row = self.series.setdefault(view, [0] * (len(self.buckets) + 2))
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                row[i] += 1
+        row[-2] += 1
+        row[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for view, row in sorted(self.series.items()):
+            for bound, count in zip(self.buckets, row):
+                lines.append(f'{self.name}_bucket{{view="{view}",le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{view="{view}",le="+Inf"}} {row[-2]}')
+            lines.append(f'{self.name}_sum{{view="{view}"}} {row[-1]:.6f}')
+            lines.append(f'{self.name}_count{{view="{view}"}} {row[-2]}')
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.responses = {}  # (view, status) -> count
+        self.histograms = {
+            "duration": Histogram("recognition_request_duration_seconds", "Wall time per request.", DURATION_BUCKETS),
+            "db_queries": Histogram("recognition_db_queries", "Database queries per request.", QUERY_BUCKETS),
+            "db_duration": Histogram("recognition_db_duration_seconds", "Database time per request.", DURATION_BUCKETS),
+            "serialize": Histogram(
+                "recognition_serialize_duration_seconds", "JSON encoding time per request.", DURATION_BUCKETS
+            ),
+            "size": Histogram("recognition_response_bytes", "Response body size (non-streaming).", SIZE_BUCKETS),
+        }
+
+    def record(self, view, status, **values):
+        """values: duration, db_queries, db_duration, serialize and (optionally) size."""
+        with self.lock:
+            self.responses[(view, status)] = self.responses.get((view, status), 0) + 1
+            for key, value in values.items():
+                if value is not None:
+                    self.histograms[key].observe(view, value)
+
+    def render(self):
+        with self.lock:
+            lines = ["# HELP recognition_responses_total Responses by view and status.", "# TYPE recognition_responses_total counter"]
+            lines += [
+                f'recognition_responses_total{{view="{view}",status="{status}"}} {count}'
+                for (view, status), count in sorted(self.responses.items())
+            ]
+            for histogram in self.histograms.values():
+                lines += histogram.render()
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
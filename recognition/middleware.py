@@ -0,0 +1,196 @@
+import asyncio
+import cProfile
+import random
+import threading
+import time
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection
+
+from . import metrics, ratelimit
+from .views import is_admin
+
+
+class QueryStats:
+    """connection.execute_wrapper that counts and times the queries it sees."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+class ProfilingMiddleware:
+    """
+    For requests served by a recognition view: wall time, DB query count and time, JSON encoding time
+    and response size, added as a Server-Timing header and to the /api/metrics histograms. Admin
+    requests sent with "X-Profile: 1" (and a RECOGNITION_PROFILE_SAMPLE_RATE fraction of all requests)
+    also run under cProfile, dumped to RECOGNITION_PROFILE_DIR. Streaming responses are only timed
+    up to the first byte. Runs natively in both the sync and the async (ASGI) handler.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        requested, profiler, stats = self.start(request)
+        token = metrics.start_request()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(stats):
+                if profiler:
+                    profiler.enable()
+                try:
+                    response = self.get_response(request)
+                finally:
+                    if profiler:
+                        profiler.disable()
+        finally:
+            serialize = metrics.end_request(token)
+        return self.finish(request, response, requested, profiler, stats, serialize, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        requested, profiler, stats = self.start(request)
+        token = metrics.start_request()
+        started = time.perf_counter()
+        # Async views reach the ORM through sync_to_async, on this request's thread and that thread's
+        # connection, so the wrapper goes on there rather than on the event loop thread's connection.
+        wrapper = await sync_to_async(self.wrap_queries)(stats)
+        try:
+            if profiler:
+                profiler.enable()
+            try:
+                response = await self.get_response(request)
+            finally:
+                if profiler:
+                    profiler.disable()
+        finally:
+            await sync_to_async(wrapper.__exit__)(None, None, None)
+            serialize = metrics.end_request(token)
+        return self.finish(request, response, requested, profiler, stats, serialize, time.perf_counter() - started)
+
+    @staticmethod
+    def wrap_queries(stats):
+        wrapper = connection.execute_wrapper(stats)
+        wrapper.__enter__()
+        return wrapper
+
+    def start(self, request):
+        requested = request.headers.get("X-Profile") == "1" and is_admin(request)
+        profiler = cProfile.Profile() if requested or random.random() < settings.RECOGNITION_PROFILE_SAMPLE_RATE else None
+        return requested, profiler, QueryStats()
+
+    def finish(self, request, response, requested, profiler, stats, serialize, duration):
+        match = getattr(request, "resolver_match", None)
+        if not match or not match.func.__module__.startswith("recognition."):
+            return response
+        view = match.func.__name__
+        size = None if response.streaming else len(response.content)
+        metrics.registry.record(
+            view, response.status_code,
+            duration=duration, db_queries=stats.count, db_duration=stats.seconds, serialize=serialize, size=size,
+        )
+        if settings.RECOGNITION_SERVER_TIMING:
+            response["Server-Timing"] = (
+                f'db;dur={stats.seconds * 1000:.2f};desc="{stats.count} queries", '
+                f"serialize;dur={serialize * 1000:.2f}, total;dur={duration * 1000:.2f}"
+            )
+        if profiler:
+            path = self.dump(profiler, view)
+            if requested:
+                response["X-Profile"] = path.name
+        return response
+
+    def dump(self, profiler, view):
+        directory = Path(settings.RECOGNITION_PROFILE_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{view}-{time.time_ns()}.prof"
+        profiler.dump_stats(path)
+        return path
+
+
+class AdmissionMiddleware:
+    """
+    Admission control for writes (POST/PUT/PATCH/DELETE) to recognition views. Requests without the
+    admin password are rate limited per client IP, and nomination_create / vote_create per
+    nominator / voter name too (429). Every write then needs one of RECOGNITION_MAX_INFLIGHT_WRITES
+    slots in this worker, waiting up to RECOGNITION_INFLIGHT_WAIT seconds for one (503). Both carry
+    Retry-After. Under ASGI the wait is a coroutine polling for a slot, not a blocked thread.
+    """
+    WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+    sync_capable = True
+    async_capable = True
+    poll_seconds = 0.005
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        slots = settings.RECOGNITION_MAX_INFLIGHT_WRITES
+        self.slots = threading.BoundedSemaphore(slots) if slots else None
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        try:
+            return self.get_response(request)
+        finally:
+            self.release(request)
+
+    async def __acall__(self, request):
+        try:
+            return await self.get_response(request)
+        finally:
+            self.release(request)
+
+    def release(self, request):
+        if getattr(request, "_write_slot", False):
+            self.slots.release()
+
+    def is_write(self, request, view_func):
+        return request.method in self.WRITE_METHODS and view_func.__module__.startswith("recognition.")
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not self.is_write(request, view_func):
+            return None
+        if settings.RECOGNITION_RATE_LIMIT and not is_admin(request):
+            wait = ratelimit.check_write(request, view_func.__name__)
+            if wait:
+                return ratelimit.rejection(429, wait, "Too many requests; slow down")
+        if self.slots:
+            if not self.slots.acquire(timeout=settings.RECOGNITION_INFLIGHT_WAIT):
+                return ratelimit.rejection(503, 1, "Server busy; retry shortly")
+            request._write_slot = True
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        if not self.is_write(request, view_func):
+            return None
+        if settings.RECOGNITION_RATE_LIMIT and not is_admin(request):
+            wait = await sync_to_async(ratelimit.check_write)(request, view_func.__name__)
+            if wait:
+                return ratelimit.rejection(429, wait, "Too many requests; slow down")
+        if self.slots:
+            deadline = time.monotonic() + settings.RECOGNITION_INFLIGHT_WAIT
+            while not self.slots.acquire(blocking=False):
+                if time.monotonic() >= deadline:
+                    return ratelimit.rejection(503, 1, "Server busy; retry shortly")
+                await asyncio.sleep(self.poll_seconds)
+            request._write_slot = True
+        return None
@@ -0,0 +1,66 @@
+# Generated by Django 5.0 on 2026-10-17 01:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_tallies(apps, schema_editor):
+    MeetingSession = apps.get_model("recognition", "MeetingSession")
+    NomineeTally = apps.get_model("recognition", "NomineeTally")
+    Vote = apps.get_model("recognition", "Vote")
+    for session in MeetingSession.objects.all():
+        counts = {}
+        none_of_above_count = 0
+        for v in Vote.objects.filter(session=session).prefetch_related("nominations"):
+            nominations = v.nominations.all()
+            if not nominations:
+                none_of_above_count += 1
+            seen = {}
+            for n in nominations:
+                key = (n.nominee_name or "").strip().lower()
+                if key and key not in seen:
+                    seen[key] = n.nominee_name.strip()
+            for key, display in seen.items():
+                counts.setdefault(key, [display, 0])[1] += 1
+        NomineeTally.objects.bulk_create(
+            NomineeTally(session=session, nominee_key=key, nominee_name=display, votes=count)
+            for key, (display, count) in counts.items()
+        )
+        MeetingSession.objects.filter(pk=session.pk).update(none_of_above_count=none_of_above_count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0010_allow_up_to_3_nominations_per_person"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meetingsession",
+            name="none_of_above_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="NomineeTally",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("nominee_key", models.CharField(max_length=255)),
+                ("nominee_name", models.CharField(max_length=255)),
+                ("votes", models.PositiveIntegerField(default=0)),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tallies",
+                        to="recognition.meetingsession",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="nomineetally",
+            constraint=models.UniqueConstraint(fields=("session", "nominee_key"), name="one_tally_per_nominee_per_session"),
+        ),
+        migrations.RunPython(backfill_tallies, migrations.RunPython.noop),
+    ]
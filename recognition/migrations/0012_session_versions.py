@@ -0,0 +1,23 @@
+# Generated by Django 5.0 on 2026-10-17 01:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0011_vote_tally"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meetingsession",
+            name="nominations_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="meetingsession",
+            name="votes_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
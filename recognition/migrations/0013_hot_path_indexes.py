@@ -0,0 +1,57 @@
+# Generated by Django 5.0 on 2026-10-17 01:43
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def drop_duplicate_votes(apps, schema_editor):
+    """Keep each voter's first vote per session so the unique constraint can be added."""
+    Vote = apps.get_model("recognition", "Vote")
+    dupes = (
+        Vote.objects.values("session_id", "voter_name")
+        .annotate(first_id=Min("id"), n=models.Count("id"))
+        .filter(n__gt=1)
+    )
+    for d in dupes:
+        Vote.objects.filter(session_id=d["session_id"], voter_name=d["voter_name"]).exclude(id=d["first_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0012_session_versions"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="meetingsession",
+            index=models.Index(fields=["-updated_at"], name="session_recent"),
+        ),
+        migrations.AddIndex(
+            model_name="meetingsession",
+            index=models.Index(
+                condition=models.Q(("phase", "closed"), _negated=True), fields=["-updated_at"], name="session_open_recent"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nomination",
+            index=models.Index(
+                models.F("session"),
+                models.F("nominator_name"),
+                django.db.models.functions.text.Upper("nominee_name"),
+                name="nomination_nominator",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nomination",
+            index=models.Index(
+                models.F("session"), django.db.models.functions.text.Lower("nominee_name"), name="nomination_session_nominee"
+            ),
+        ),
+        migrations.RunPython(drop_duplicate_votes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="vote",
+            constraint=models.UniqueConstraint(fields=("session", "voter_name"), name="one_vote_per_person_per_session"),
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.0 on 2026-10-17 01:45
+
+from django.db import migrations, models
+
+
+def normalize(name):
+    return " ".join((name or "").split()).casefold()
+
+
+def backfill_nominee_key(apps, schema_editor):
+    """
+    Fill nominee_key and rebuild tallies, whose keys used the older strip().lower() form. None of the
+    above is recounted too: 0011 counted it before 0013 dropped duplicate votes.
+    """
+    MeetingSession = apps.get_model("recognition", "MeetingSession")
+    Nomination = apps.get_model("recognition", "Nomination")
+    NomineeTally = apps.get_model("recognition", "NomineeTally")
+    Vote = apps.get_model("recognition", "Vote")
+    for n in Nomination.objects.only("id", "nominee_name").iterator():
+        Nomination.objects.filter(pk=n.pk).update(nominee_key=normalize(n.nominee_name))
+    NomineeTally.objects.all().delete()
+    for session in MeetingSession.objects.all():
+        counts = {}
+        none_of_above_count = 0
+        for v in Vote.objects.filter(session=session).prefetch_related("nominations"):
+            nominations = v.nominations.all()
+            if not nominations:
+                none_of_above_count += 1
+            seen = {}
+            for n in nominations:
+                if n.nominee_key and n.nominee_key not in seen:
+                    seen[n.nominee_key] = n.nominee_name.strip()
+            for key, display in seen.items():
+                counts.setdefault(key, [display, 0])[1] += 1
+        NomineeTally.objects.bulk_create(
+            NomineeTally(session=session, nominee_key=key, nominee_name=display, votes=count)
+            for key, (display, count) in counts.items()
+        )
+        MeetingSession.objects.filter(pk=session.pk).update(none_of_above_count=none_of_above_count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0013_hot_path_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="nomination",
+            name="nomination_nominator",
+        ),
+        migrations.RemoveIndex(
+            model_name="nomination",
+            name="nomination_session_nominee",
+        ),
+        migrations.AddField(
+            model_name="nomination",
+            name="nominee_key",
+            field=models.CharField(default="", editable=False, max_length=255),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_nominee_key, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="nomination",
+            index=models.Index(fields=["session", "nominator_name", "nominee_key"], name="nomination_nominator"),
+        ),
+        migrations.AddIndex(
+            model_name="nomination",
+            index=models.Index(fields=["session", "nominee_key"], name="nomination_session_nominee"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0 on 2026-10-17 01:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0014_nomination_nominee_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionArchive",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("results", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("session", models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="archive", to="recognition.meetingsession")),
+            ],
+        ),
+    ]
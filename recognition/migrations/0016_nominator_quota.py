@@ -0,0 +1,71 @@
+# Generated by Django 5.0 on 2026-10-17 02:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_nominations(apps, schema_editor):
+    """Keep each nominator's first nomination per nominee; votes for the duplicates move onto it."""
+    Nomination = apps.get_model("recognition", "Nomination")
+    Through = apps.get_model("recognition", "Vote").nominations.through
+    dupes = (
+        Nomination.objects.values("session_id", "nominator_name", "nominee_key")
+        .annotate(first_id=Min("id"), n=Count("id"))
+        .filter(n__gt=1)
+    )
+    for d in dupes:
+        extra = Nomination.objects.filter(
+            session_id=d["session_id"], nominator_name=d["nominator_name"], nominee_key=d["nominee_key"]
+        ).exclude(id=d["first_id"])
+        linked = set(Through.objects.filter(nomination_id=d["first_id"]).values_list("vote_id", flat=True))
+        for link in Through.objects.filter(nomination__in=extra):
+            if link.vote_id not in linked:
+                linked.add(link.vote_id)
+                Through.objects.create(vote_id=link.vote_id, nomination_id=d["first_id"])
+        extra.delete()
+
+
+def backfill_quotas(apps, schema_editor):
+    Nomination = apps.get_model("recognition", "Nomination")
+    NominatorQuota = apps.get_model("recognition", "NominatorQuota")
+    NominatorQuota.objects.bulk_create(
+        NominatorQuota(session_id=row["session_id"], nominator_name=row["nominator_name"], used=row["n"])
+        for row in Nomination.objects.values("session_id", "nominator_name").annotate(n=Count("id"))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0015_session_archive"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_nominations, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="nomination",
+            name="nomination_nominator",
+        ),
+        migrations.AddConstraint(
+            model_name="nomination",
+            constraint=models.UniqueConstraint(
+                fields=("session", "nominator_name", "nominee_key"), name="one_nomination_per_nominee_per_nominator"
+            ),
+        ),
+        migrations.CreateModel(
+            name="NominatorQuota",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("nominator_name", models.CharField(max_length=255)),
+                ("used", models.PositiveIntegerField(default=0)),
+                ("session", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="quotas", to="recognition.meetingsession")),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("session", "nominator_name"), name="one_quota_per_nominator_per_session")
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_quotas, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0 on 2026-10-17 02:15
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0016_nominator_quota"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingVote",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("receipt", models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ("voter_name", models.CharField(max_length=255)),
+                ("nomination_ids", models.JSONField(default=list)),
+                ("status", models.CharField(default="pending", max_length=10)),
+                ("error", models.CharField(blank=True, max_length=255)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("session", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="pending_votes", to="recognition.meetingsession")),
+            ],
+            options={
+                "indexes": [models.Index(condition=models.Q(("status", "pending")), fields=["id"], name="pending_vote_queue")],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="pendingvote",
+            constraint=models.UniqueConstraint(fields=("session", "voter_name"), name="one_pending_vote_per_voter_per_session"),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0 on 2026-10-17 02:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0017_pending_vote"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="meetingsession",
+            name="session_recent",
+        ),
+        migrations.AddIndex(
+            model_name="meetingsession",
+            index=models.Index(fields=["-updated_at", "-id"], name="session_recent"),
+        ),
+        migrations.AddIndex(
+            model_name="meetingsession",
+            index=models.Index(fields=["phase", "-updated_at", "-id"], name="session_phase_recent"),
+        ),
+    ]
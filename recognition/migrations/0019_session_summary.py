@@ -0,0 +1,54 @@
+# Generated by Django 5.0 on 2026-10-17 02:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+TOP_N = 10  # RECOGNITION_SUMMARY_TOP_N's default
+
+
+def normalize(name):
+    return " ".join((name or "").split()).casefold()
+
+
+def summarize_archives(apps, schema_editor):
+    """Summaries for sessions closed with an archive before summaries existed; the others left no results."""
+    SessionArchive = apps.get_model("recognition", "SessionArchive")
+    SessionSummary = apps.get_model("recognition", "SessionSummary")
+    for archive in SessionArchive.objects.select_related("session"):
+        rows = [{"key": normalize(r["name"]), "name": r["name"], "count": r["count"]} for r in archive.results.get("vote_counts", [])]
+        winners = set(archive.results.get("winners", []))
+        SessionSummary.objects.get_or_create(
+            session=archive.session,
+            defaults={
+                "held_on": archive.session.meeting_date or archive.created_at.date(),
+                "winners": [r for r in rows if r["name"] in winners],
+                "top": rows[:TOP_N],
+                "none_of_above_count": archive.results.get("none_of_above_count", 0),
+            },
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0018_session_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionSummary",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("held_on", models.DateField()),
+                ("winners", models.JSONField()),
+                ("top", models.JSONField()),
+                ("none_of_above_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("session", models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="summary", to="recognition.meetingsession")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["held_on"], name="summary_held_on")],
+            },
+        ),
+        migrations.RunPython(summarize_archives, migrations.RunPython.noop),
+    ]
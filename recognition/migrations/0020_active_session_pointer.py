@@ -0,0 +1,36 @@
+# Generated by Django 5.0 on 2026-10-17 02:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def point_at_newest(apps, schema_editor):
+    MeetingSession = apps.get_model("recognition", "MeetingSession")
+    ActiveSession = apps.get_model("recognition", "ActiveSession")
+    latest = MeetingSession.objects.order_by("-updated_at", "-id").first()
+    newest_open = MeetingSession.objects.exclude(phase="closed").order_by("-updated_at", "-id").first()
+    ActiveSession.objects.update_or_create(pk=1, defaults={
+        "latest": latest, "latest_at": latest and latest.updated_at,
+        "latest_open": newest_open, "latest_open_at": newest_open and newest_open.updated_at,
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0019_session_summary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActiveSession",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("latest_at", models.DateTimeField(null=True)),
+                ("latest_open_at", models.DateTimeField(null=True)),
+                ("latest", models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to="recognition.meetingsession")),
+                ("latest_open", models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to="recognition.meetingsession")),
+            ],
+        ),
+        migrations.RunPython(point_at_newest, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0 on 2026-10-17 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recognition", "0020_active_session_pointer"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sessionsummary",
+            name="nomination_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sessionsummary",
+            name="nominator_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sessionsummary",
+            name="vote_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -1,4 +1,11 @@
-from django.db import models
+import uuid
+
+from django.db import models, transaction
+
+
+def normalize_nominee(name):
+    """Key that identifies a nominee: trimmed, case-folded, inner whitespace collapsed."""
+    return " ".join((name or "").split()).casefold()
 
 
 class MeetingSession(models.Model):
@@ -13,25 +20,122 @@ class MeetingSession(models.Model):
     title = models.CharField(max_length=255, default="Fortnightly Goal Review")
     meeting_date = models.DateField(null=True, blank=True)
     phase = models.CharField(max_length=20, choices=PHASE_CHOICES, default="setup")
+    none_of_above_count = models.PositiveIntegerField(default=0)
+    # Bumped on every nomination / vote write; together with updated_at they version the API payloads.
+    nominations_version = models.PositiveIntegerField(default=0)
+    votes_version = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # "most recently updated session" (session_get, _resolve_session) and /api/sessions pages
+            models.Index(fields=["-updated_at", "-id"], name="session_recent"),
+            models.Index(fields=["-updated_at"], condition=~models.Q(phase="closed"), name="session_open_recent"),
+            # /api/sessions?phase=
+            models.Index(fields=["phase", "-updated_at", "-id"], name="session_phase_recent"),
+        ]
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            ActiveSession.point_at(self)
+
     def __str__(self):
         return f"{self.title} ({self.phase})"
 
 
+class ActiveSession(models.Model):
+    """
+    Singleton row (pk 1) naming the most recently updated session and the most recently updated open
+    one, so requests without session_id resolve "the current session" with a primary-key read. It is
+    moved in the transaction of every MeetingSession.save(); the *_at columns stop a writer that
+    commits late from moving a pointer back to an older update.
+    """
+    latest = models.ForeignKey(MeetingSession, null=True, on_delete=models.SET_NULL, related_name="+")
+    latest_at = models.DateTimeField(null=True)
+    latest_open = models.ForeignKey(MeetingSession, null=True, on_delete=models.SET_NULL, related_name="+")
+    latest_open_at = models.DateTimeField(null=True)
+
+    @classmethod
+    def point_at(cls, session):
+        """Move the pointers to a just-saved session (rebuilding a missing row)."""
+        row = cls.objects.filter(pk=1)
+        at = session.updated_at
+        moved = row.filter(models.Q(latest_at__isnull=True) | models.Q(latest_at__lte=at)).update(latest=session, latest_at=at)
+        if session.phase == "closed":  # if it held the open pointer, hand that to the newest open session
+            newest = MeetingSession.objects.exclude(phase="closed").order_by("-updated_at", "-id")
+            row.filter(latest_open=session).update(
+                latest_open=models.Subquery(newest.values("pk")[:1]),
+                latest_open_at=models.Subquery(newest.values("updated_at")[:1]),
+            )
+        else:
+            row.filter(models.Q(latest_open_at__isnull=True) | models.Q(latest_open_at__lte=at)).update(
+                latest_open=session, latest_open_at=at
+            )
+        if not moved and not row.exists():  # first save, or the row was removed
+            latest, newest_open = newest_session(), newest_session(open_only=True)
+            cls.objects.update_or_create(pk=1, defaults={
+                "latest": latest, "latest_at": latest and latest.updated_at,
+                "latest_open": newest_open, "latest_open_at": newest_open and newest_open.updated_at,
+            })
+
+    def __str__(self):
+        return f"Latest: {self.latest_id}, latest open: {self.latest_open_id}"
+
+
+def newest_session(open_only=False):
+    """Most recently updated session (open_only: excluding closed ones), by the ordered index scan."""
+    sessions = MeetingSession.objects.exclude(phase="closed") if open_only else MeetingSession.objects.all()
+    return sessions.order_by("-updated_at", "-id").first()
+
+
 class Nomination(models.Model):
     """Up to 3 nominations per person per session; deleted when session closes."""
     session = models.ForeignKey(MeetingSession, on_delete=models.CASCADE, related_name="nominations")
     nominator_name = models.CharField(max_length=255)
     nominee_name = models.CharField(max_length=255)
+    nominee_key = models.CharField(max_length=255, editable=False)  # normalize_nominee(nominee_name), set on save
     reason = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # nominations_list ordering and results grouping
+            models.Index(fields=["session", "nominee_key"], name="nomination_session_nominee"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=("session", "nominator_name", "nominee_key"), name="one_nomination_per_nominee_per_nominator"
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.nominee_key = normalize_nominee(self.nominee_name)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "nominee_name" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "nominee_key"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.nominee_name}"
 
 
+class NominatorQuota(models.Model):
+    """Nominations used by one nominator in a session; claimed with a conditional UPDATE so the cap holds under concurrency."""
+    session = models.ForeignKey(MeetingSession, on_delete=models.CASCADE, related_name="quotas")
+    nominator_name = models.CharField(max_length=255)
+    used = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("session", "nominator_name"), name="one_quota_per_nominator_per_session"),
+        ]
+
+    def __str__(self):
+        return f"{self.nominator_name}: {self.used}"
+
+
 class Vote(models.Model):
     """One vote per session per person; deleted when session closes."""
     session = models.ForeignKey(MeetingSession, on_delete=models.CASCADE, related_name="votes")
@@ -39,5 +143,80 @@ class Vote(models.Model):
     nominations = models.ManyToManyField(Nomination, blank=True)  # empty = None of the above
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("session", "voter_name"), name="one_vote_per_person_per_session"),
+        ]
+
     def __str__(self):
         return f"{self.voter_name}"
+
+
+class PendingVote(models.Model):
+    """A vote accepted by vote_create in queue mode (VOTE_QUEUE) and not yet, or never, turned into a Vote."""
+    PENDING, RECORDED, REJECTED = "pending", "recorded", "rejected"
+    session = models.ForeignKey(MeetingSession, on_delete=models.CASCADE, related_name="pending_votes")
+    receipt = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    voter_name = models.CharField(max_length=255)
+    nomination_ids = models.JSONField(default=list)
+    status = models.CharField(max_length=10, default=PENDING)
+    error = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("session", "voter_name"), name="one_pending_vote_per_voter_per_session"),
+        ]
+        indexes = [
+            # the flusher's "oldest pending first" scan
+            models.Index(fields=["id"], condition=models.Q(status="pending"), name="pending_vote_queue"),
+        ]
+
+    def __str__(self):
+        return f"{self.voter_name} ({self.status})"
+
+
+class NomineeTally(models.Model):
+    """Running vote count per normalized nominee; kept in step with Vote rows by vote_create."""
+    session = models.ForeignKey(MeetingSession, on_delete=models.CASCADE, related_name="tallies")
+    nominee_key = models.CharField(max_length=255)
+    nominee_name = models.CharField(max_length=255)
+    votes = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("session", "nominee_key"), name="one_tally_per_nominee_per_session"),
+        ]
+
+    def __str__(self):
+        return f"{self.nominee_name}: {self.votes}"
+
+
+class SessionArchive(models.Model):
+    """Final results snapshot that outlives the raw rows deleted when a session closes."""
+    session = models.OneToOneField(MeetingSession, on_delete=models.CASCADE, related_name="archive")
+    results = models.JSONField()  # {"vote_counts": [...], "winners": [...], "none_of_above_count": int}
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Archive of {self.session}"
+
+
+class SessionSummary(models.Model):
+    """Compact results written whenever a session closes; what /api/history aggregates over."""
+    session = models.OneToOneField(MeetingSession, on_delete=models.CASCADE, related_name="summary")
+    held_on = models.DateField()  # meeting_date, else the day it closed
+    winners = models.JSONField()  # [{"key": nominee_key, "name": ..., "count": votes}, ...]
+    top = models.JSONField()  # the same, for the RECOGNITION_SUMMARY_TOP_N most voted nominees
+    none_of_above_count = models.PositiveIntegerField(default=0)
+    # Row counts at close, for session listings once the rows are purged
+    nomination_count = models.PositiveIntegerField(default=0)
+    nominator_count = models.PositiveIntegerField(default=0)
+    vote_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["held_on"], name="summary_held_on")]
+
+    def __str__(self):
+        return f"Summary of {self.session}"
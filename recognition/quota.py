@@ -0,0 +1,51 @@
+"""
+Per-nominator nomination cap backed by a NominatorQuota counter row. A slot is claimed with one
+conditional UPDATE (used < cap), so concurrent requests cannot push a nominator past the cap.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from .models import Nomination, NominatorQuota
+
+MAX_NOMINATIONS = 3
+
+
+def claim(session, nominator_name):
+    """Take one of the nominator's slots inside the caller's transaction; False when all are used."""
+    rows = NominatorQuota.objects.filter(session=session, nominator_name=nominator_name, used__lt=MAX_NOMINATIONS)
+    if rows.update(used=F("used") + 1):
+        return True
+    # No row yet (or the cap is reached): seed the counter from any rows written before it existed.
+    used = Nomination.objects.filter(session=session, nominator_name=nominator_name).count()
+    if used >= MAX_NOMINATIONS:
+        return False
+    try:
+        with transaction.atomic():
+            NominatorQuota.objects.create(session=session, nominator_name=nominator_name, used=used + 1)
+        return True
+    except IntegrityError:  # the row exists: full, or seeded concurrently
+        return bool(rows.update(used=F("used") + 1))
+
+
+def sync(session, nominator_names):
+    """
+    Reset the nominators' counters to their actual nomination counts (after bulk inserts and deletes)
+    in two queries; returns the nominators now over the cap.
+    """
+    counts = dict.fromkeys(nominator_names, 0)
+    counts.update(
+        Nomination.objects.filter(session=session, nominator_name__in=counts)
+        .values_list("nominator_name")
+        .annotate(n=Count("id"))
+    )
+    NominatorQuota.objects.bulk_create(
+        [NominatorQuota(session=session, nominator_name=name, used=n) for name, n in counts.items()],
+        update_conflicts=True,
+        unique_fields=["session", "nominator_name"],
+        update_fields=["used"],
+    )
+    return [name for name, n in counts.items() if n > MAX_NOMINATIONS]
+
+
+def clear(session):
+    NominatorQuota.objects.filter(session=session).delete()
@@ -0,0 +1,139 @@
+"""
+Token-bucket rate limits for AdmissionMiddleware and admin_required. A limit is "count/seconds": the
+bucket holds up to count tokens and refills count of them every `seconds`. Bucket state lives in
+RECOGNITION_RATE_LIMIT_BACKEND: InProcessBuckets for a single worker, CacheBuckets to share it across
+workers through a Django cache (database, file, Redis, ...).
+"""
+import json
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+from .http import JsonResponse
+
+# Participant write views limited per name as well as per IP, and the body field naming the person.
+NAME_FIELDS = {"nomination_create": "nominator_name", "vote_create": "voter_name"}
+
+
+def parse_limit(spec):
+    """Parse "count/seconds" into (capacity, tokens per second)."""
+    count, seconds = spec.split("/")
+    return int(count), int(count) / float(seconds)
+
+
+def _refill(state, capacity, rate, now):
+    tokens, stamp = state if state else (capacity, now)
+    return min(capacity, tokens + max(0.0, now - stamp) * rate)
+
+
+def _spend(tokens, rate, consume):
+    """(tokens left, seconds to wait): one token is spent if there is one and consume is set."""
+    if tokens >= 1:
+        return (tokens - 1 if consume else tokens), 0.0
+    return tokens, (1 - tokens) / rate
+
+
+class InProcessBuckets:
+    """Buckets in this process's memory; idle (refilled) buckets are dropped once max_keys is reached."""
+    max_keys = 100_000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def take(self, key, capacity, rate, consume=True):
+        """Seconds until a token is available (0: one was, and was spent unless consume is False)."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._buckets.get(key)
+            tokens, wait = _spend(_refill(state and state[:2], capacity, rate, now), rate, consume)
+            if state is None and len(self._buckets) >= self.max_keys:
+                self._prune(now)
+            self._buckets[key] = (tokens, now, now + (capacity - tokens) / rate)  # last field: when it is full again
+        return wait
+
+    def _prune(self, now):
+        self._buckets = {key: state for key, state in self._buckets.items() if state[2] > now}
+        if len(self._buckets) >= self.max_keys:  # all busy: fail open rather than grow without bound
+            self._buckets.clear()
+
+
+class CacheBuckets:
+    """
+    Buckets kept in a Django cache so every worker shares them. Read-modify-write is not atomic, so
+    concurrent requests for one key can overspend by a token or two.
+    """
+
+    def __init__(self, alias="default"):
+        self.cache = caches[alias]
+
+    def take(self, key, capacity, rate, consume=True):
+        now = time.time()
+        cache_key = f"recognition:ratelimit:{key}"
+        tokens, wait = _spend(_refill(self.cache.get(cache_key), capacity, rate, now), rate, consume)
+        self.cache.set(cache_key, (tokens, now), timeout=math.ceil(capacity / rate) + 1)  # gone once full again
+        return wait
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend():
+    path = settings.RECOGNITION_RATE_LIMIT_BACKEND
+    with _backends_lock:
+        if path not in _backends:
+            _backends[path] = import_string(path)()
+        return _backends[path]
+
+
+def client_ip(request):
+    """REMOTE_ADDR, or with RECOGNITION_PROXY_COUNT proxies in front the address the outermost one saw."""
+    proxies = settings.RECOGNITION_PROXY_COUNT
+    if proxies:
+        forwarded = [part.strip() for part in request.headers.get("X-Forwarded-For", "").split(",") if part.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def _body_name(request, field):
+    try:
+        name = json.loads(request.body).get(field)
+    except (ValueError, AttributeError):
+        return None
+    return " ".join(name.split()).casefold() if isinstance(name, str) else None
+
+
+def check_write(request, view_name):
+    """Spend the request's IP token (and name token for NAME_FIELDS views); seconds to wait if one is exhausted."""
+    backend = get_backend()
+    limits = [(f"ip:{client_ip(request)}", settings.RECOGNITION_RATE_LIMIT_IP)]
+    name = _body_name(request, NAME_FIELDS[view_name]) if view_name in NAME_FIELDS else None
+    if name:
+        limits.append((f"name:{name}", settings.RECOGNITION_RATE_LIMIT_NAME))
+    for key, spec in limits:
+        wait = backend.take(key, *parse_limit(spec))
+        if wait:
+            return wait
+    return 0.0
+
+
+def auth_blocked(request):
+    """Seconds until this client's admin requests are answered again; 0 if they are now."""
+    return get_backend().take(f"auth:{client_ip(request)}", *parse_limit(settings.RECOGNITION_RATE_LIMIT_AUTH), consume=False)
+
+
+def auth_failed(request):
+    get_backend().take(f"auth:{client_ip(request)}", *parse_limit(settings.RECOGNITION_RATE_LIMIT_AUTH))
+
+
+def rejection(status, retry_after, error):
+    """429 / 503 JSON response with a whole-second Retry-After."""
+    response = JsonResponse({"error": error}, status=status)
+    response["Retry-After"] = str(max(1, math.ceil(retry_after)))
+    return response
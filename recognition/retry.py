@@ -0,0 +1,27 @@
+"""Write transactions that survive transient SQLite lock contention."""
+import functools
+import random
+import time
+
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+
+
+def write_transaction(func):
+    """
+    Run func inside transaction.atomic() (BEGIN IMMEDIATE under SQLITE_TUNING) and retry it with
+    jittered exponential backoff when the database reports itself locked. Nested in an outer
+    atomic block there is nothing safe to retry, so the error propagates.
+    """
+    @functools.wraps(func)
+    def wrapped(*args, **kwargs):
+        retries = settings.RECOGNITION_WRITE_RETRIES
+        for attempt in range(retries + 1):
+            try:
+                with transaction.atomic():
+                    return func(*args, **kwargs)
+            except OperationalError as exc:
+                if "locked" not in str(exc) or attempt == retries or connection.in_atomic_block:
+                    raise
+                time.sleep(0.02 * 2**attempt * (1 + random.random()))
+    return wrapped
@@ -0,0 +1,113 @@
+"""Materialized vote tallies: results are read from NomineeTally instead of walking every Vote."""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Min
+from django.db.models.functions import Trim
+
+from .models import MeetingSession, NomineeTally, Vote
+
+
+def record_votes(session, ballots):
+    """Count votes, each given as its list of nominations (empty = none of the above). Call inside the votes' transaction."""
+    deltas = {}  # key -> [display, count]
+    none_of_above = 0
+    for nominations in ballots:
+        if not nominations:
+            none_of_above += 1
+            continue
+        seen = set()
+        for n in nominations:
+            if n.nominee_key and n.nominee_key not in seen:
+                seen.add(n.nominee_key)
+                deltas.setdefault(n.nominee_key, [n.nominee_name.strip(), 0])[1] += 1
+    if none_of_above:
+        MeetingSession.objects.filter(pk=session.pk).update(none_of_above_count=F("none_of_above_count") + none_of_above)
+    for key, (display, count) in deltas.items():
+        row = NomineeTally.objects.filter(session=session, nominee_key=key)
+        if row.update(votes=F("votes") + count):  # one query once the nominee has a row
+            continue
+        try:
+            with transaction.atomic():
+                NomineeTally.objects.create(session=session, nominee_key=key, nominee_name=display, votes=count)
+        except IntegrityError:  # created concurrently
+            row.update(votes=F("votes") + count)
+
+
+def record_vote(session, nominations):
+    record_votes(session, [nominations])
+
+
+def aggregate_rows(session):
+    """
+    One grouped query over Vote LEFT JOIN its nominations: distinct votes per nominee key.
+    The NULL-key group holds votes with no nominations (none of the above).
+    """
+    return (
+        Vote.objects.filter(session=session)
+        .values(key=F("nominations__nominee_key"))
+        .annotate(display=Min(Trim("nominations__nominee_name")), count=Count("id", distinct=True), first_vote=Min("id"))
+        .order_by("first_vote", "key")
+    )
+
+
+def aggregate_results(session):
+    """Session results computed straight from Vote rows in a single round-trip."""
+    counts, none_of_above_count = [], 0
+    for row in aggregate_rows(session):
+        if row["key"] is None:
+            none_of_above_count = row["count"]
+        elif row["key"]:
+            counts.append(row)
+    vote_counts = [{"name": r["display"], "count": r["count"]} for r in sorted(counts, key=lambda r: -r["count"])]
+    max_count = vote_counts[0]["count"] if vote_counts else 0
+    winners = [x["name"] for x in vote_counts if x["count"] == max_count and max_count > 0]
+    return {"vote_counts": vote_counts, "winners": winners, "none_of_above_count": none_of_above_count}
+
+
+def forget_nomination(session, nomination):
+    """
+    Take a nomination about to be deleted out of the tally: its nominee loses the votes that named
+    no other nomination with the same key, and votes left with no nominations become none of the
+    above. Touches only that nomination's votes; call inside the delete's transaction.
+    """
+    links = Vote.nominations.through.objects
+    votes = links.filter(nomination_id=nomination.pk)
+    others = links.filter(vote_id__in=votes.values("vote_id")).exclude(nomination_id=nomination.pk)
+    lost = votes.exclude(vote_id__in=others.filter(nomination__nominee_key=nomination.nominee_key).values("vote_id")).count()
+    emptied = votes.exclude(vote_id__in=others.values("vote_id")).count()
+    if lost:
+        NomineeTally.objects.filter(session=session, nominee_key=nomination.nominee_key).update(votes=F("votes") - lost)
+    if emptied:
+        MeetingSession.objects.filter(pk=session.pk).update(none_of_above_count=F("none_of_above_count") + emptied)
+
+
+@transaction.atomic
+def rebuild_tally(session):
+    """Replace the session's tally with counts recomputed from its Vote rows."""
+    rows = list(aggregate_rows(session))
+    none_of_above_count = next((r["count"] for r in rows if r["key"] is None), 0)
+    NomineeTally.objects.filter(session=session).delete()
+    NomineeTally.objects.bulk_create(
+        NomineeTally(session=session, nominee_key=r["key"], nominee_name=r["display"], votes=r["count"])
+        for r in rows
+        if r["key"]
+    )
+    MeetingSession.objects.filter(pk=session.pk).update(none_of_above_count=none_of_above_count)
+    session.none_of_above_count = none_of_above_count
+
+
+def clear_tally(session):
+    """Drop the session's tally rows; none_of_above_count stays, as the closed session's final count."""
+    NomineeTally.objects.filter(session=session).delete()
+
+
+def results_from_tally(session):
+    """vote_counts / winners / none_of_above_count from one indexed read of the tally."""
+    vote_counts = [
+        {"name": name, "count": votes}
+        for name, votes in NomineeTally.objects.filter(session=session, votes__gt=0)
+        .order_by("-votes", "id")
+        .values_list("nominee_name", "votes")
+    ]
+    max_count = vote_counts[0]["count"] if vote_counts else 0
+    winners = [x["name"] for x in vote_counts if x["count"] == max_count and max_count > 0]
+    return {"vote_counts": vote_counts, "winners": winners, "none_of_above_count": session.none_of_above_count}
@@ -1,14 +1,27 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# Participant-facing and streaming endpoints; the ASGI entry point (config/asgi.py) swaps in the async variants.
+participant = async_views if settings.RECOGNITION_ASYNC_VIEWS else views
 
 urlpatterns = [
     path("auth/check", views.admin_check),
     path("qr-join", views.qr_join),
-    path("session", views.session_get),
+    path("metrics", views.metrics_view),
+    path("sessions", views.sessions_list),
+    path("sessions/<int:session_id>/export/<str:kind>", participant.session_export),
+    path("history", views.history_view),
+    path("session", participant.session_get),
+    path("session/stream", participant.session_stream),
     path("session/create", views.session_create),
     path("session/patch", views.session_patch),
-    path("nominations", views.nominations_list),
-    path("nominations/create", views.nomination_create),
+    path("nominations", participant.nominations_list),
+    path("nominations/grouped", participant.nominations_grouped),
+    path("nominations/create", participant.nomination_create),
+    path("nominations/bulk", views.nominations_bulk),
     path("nominations/<int:nomination_id>/delete", views.nomination_delete),
-    path("votes/create", views.vote_create),
+    path("votes/create", participant.vote_create),
+    path("votes/bulk", views.votes_bulk),
+    path("votes/status", views.vote_status),
 ]
@@ -1,22 +1,50 @@
+import base64
+import binascii
+import functools
+import hashlib
 import json
-from django.db.models import Count
-from django.db.models.functions import Lower
-from django.http import JsonResponse
+import time
+from datetime import date, datetime
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.conf import settings
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
+from . import archive, bulk, cache, counts, events, export, grouping, history, http, metrics, quota, ratelimit, tally, votequeue
+from .http import JsonResponse, RawJSON, RowEncoder
 from .models import MeetingSession, Nomination, Vote
+from .retry import write_transaction
+
+
+def is_admin(request):
+    auth = request.headers.get("Authorization") or ""
+    return auth.startswith("Bearer ") and auth[7:] == settings.ADMIN_PASSWORD
 
 
 def admin_required(f):
+    """
+    401 without the admin password. A client over RECOGNITION_RATE_LIMIT_AUTH failed attempts gets
+    429 for every request, the right password included, until its bucket refills; clients behind a
+    shared proxy are told apart through PROXY_COUNT.
+    """
+    @functools.wraps(f)
     def wrapped(request, *args, **kwargs):
-        auth = request.headers.get("Authorization") or ""
-        if not auth.startswith("Bearer ") or auth[7:] != settings.ADMIN_PASSWORD:
-            return JsonResponse({"error": "Unauthorized"}, status=401)
-        return f(request, *args, **kwargs)
+        if settings.RECOGNITION_RATE_LIMIT:
+            wait = ratelimit.auth_blocked(request)
+            if wait:
+                return ratelimit.rejection(429, wait, "Too many failed attempts")
+        if is_admin(request):
+            return f(request, *args, **kwargs)
+        if settings.RECOGNITION_RATE_LIMIT:
+            ratelimit.auth_failed(request)
+        return JsonResponse({"error": "Unauthorized"}, status=401)
     return wrapped
 
 
@@ -32,29 +60,29 @@ def session_to_dict(s):
 
 def _get_results_for_session(session):
     """Vote counts by unique nominee (case-insensitive), one count per vote per nominee."""
-    name_to_count = {}  # key: lowercase; value: {"display": str, "count": int}
-    for v in Vote.objects.filter(session=session).prefetch_related("nominations"):
-        seen = set()
-        display_for = {}
-        for n in v.nominations.all():
-            key = (n.nominee_name or "").strip().lower()
-            if not key:
-                continue
-            seen.add(key)
-            if key not in display_for:
-                display_for[key] = (n.nominee_name or "").strip()
-        for key in seen:
-            if key not in name_to_count:
-                name_to_count[key] = {"display": display_for[key], "count": 0}
-            name_to_count[key]["count"] += 1
-    vote_counts = sorted(
-        [{"name": v["display"], "count": v["count"]} for v in name_to_count.values()],
-        key=lambda x: -x["count"],
-    )
-    max_count = vote_counts[0]["count"] if vote_counts else 0
-    winners = [x["name"] for x in vote_counts if x["count"] == max_count and max_count > 0]
-    none_of_above_count = Vote.objects.filter(session=session).annotate(nc=Count("nominations")).filter(nc=0).count()
-    return {"vote_counts": vote_counts, "winners": winners, "none_of_above_count": none_of_above_count}
+    def build():
+        if (session.phase or "").lower() == "closed":  # raw rows are gone; use the archive if one was kept
+            return archive.archived_results(session) or {"vote_counts": [], "winners": [], "none_of_above_count": 0}
+        return tally.results_from_tally(session)
+
+    return cache.cached("results", session, build)
+
+
+def _session_etag(session):
+    return quote_etag(cache.version_tag(session, "session") if session else "session-none")
+
+
+def _nominations_etag(session):
+    return quote_etag(cache.version_tag(session, "nominations"))
+
+
+def _conditional(request, etag, build):
+    """304 if If-None-Match matches etag, else the JsonResponse returned by build(); both carry the ETag."""
+    response = get_conditional_response(request, etag=etag) or build()
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        patch_cache_control(response, no_cache=True)
+    return response
 
 
 def _resolve_session(request, session_id_from_body=None):
@@ -65,7 +93,7 @@ def _resolve_session(request, session_id_from_body=None):
             return MeetingSession.objects.get(id=sid)
         except (MeetingSession.DoesNotExist, ValueError):
             return None
-    return MeetingSession.objects.order_by("-updated_at").first()
+    return cache.active_session()
 
 
 VALID_TRANSITIONS = {
@@ -83,6 +111,28 @@ def admin_check(request):
     return JsonResponse({"ok": True})
 
 
+@require_http_methods(["GET"])
+@admin_required
+def metrics_view(request):
+    """Admin: per-view request histograms (this process) in the Prometheus text format."""
+    return HttpResponse(metrics.registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def _session_payload(session):
+    payload = {"session": session_to_dict(session) if session else None}
+    if session:
+        phase = (session.phase or "").lower()
+        if phase in ("results", "closed"):
+            payload.update(_get_results_for_session(session))
+        else:
+            payload["vote_counts"], payload["winners"], payload["none_of_above_count"] = [], [], 0
+    return payload
+
+
+def _session_response(request, session):
+    return _conditional(request, _session_etag(session), lambda: JsonResponse(_session_payload(session)))
+
+
 @require_http_methods(["GET"])
 def session_get(request):
     """GET session; returns results (vote_counts, winners, none_of_above) only when phase is results/closed."""
@@ -93,16 +143,96 @@ def session_get(request):
         except (MeetingSession.DoesNotExist, ValueError):
             return JsonResponse({"session": None, "error": "Session not found"})
     else:
-        session = MeetingSession.objects.exclude(phase="closed").order_by("-updated_at").first()
+        session = cache.active_session(open_only=True)
+    return _session_response(request, session)
 
-    payload = {"session": session_to_dict(session) if session else None}
-    if session:
-        phase = (session.phase or "").lower()
-        if phase in ("results", "closed"):
-            payload.update(_get_results_for_session(session))
-        else:
-            payload["vote_counts"], payload["winners"], payload["none_of_above_count"] = [], [], 0
-    return JsonResponse(payload)
+
+def _session_event(session_id, last_event_id):
+    """(SSE frame carrying the session payload, its id = payload hash); the frame is None if last_event_id is still current."""
+    data = json.dumps(_session_payload(MeetingSession.objects.filter(pk=session_id).first()), cls=DjangoJSONEncoder)
+    event_id = hashlib.sha1(data.encode()).hexdigest()[:16]
+    if event_id == last_event_id:
+        return None, event_id
+    return f"id: {event_id}\nevent: session\ndata: {data}\n\n", event_id
+
+
+def _event_stream(session_id, last_event_id):
+    """SSE frames: the session payload whenever it changes, heartbeats in between."""
+    broker = events.get_broker()
+    heartbeat = settings.SSE_HEARTBEAT_SECONDS
+    deadline = time.monotonic() + settings.SSE_MAX_STREAM_SECONDS
+    yield f"retry: {settings.SSE_RETRY_MS}\n\n"
+    seq = broker.current(session_id)
+    while True:
+        frame, last_event_id = _session_event(session_id, last_event_id)
+        if frame:
+            yield frame
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            new_seq = broker.wait(session_id, seq, min(heartbeat, remaining))
+            if new_seq != seq:
+                seq = new_seq
+                break
+            yield ": heartbeat\n\n"
+
+
+class _StreamSlot:
+    """SSE frames holding an events.open_stream() slot, freed when they end or the response is closed."""
+
+    def __init__(self, frames, slot):
+        self.frames, self.slot = frames, slot
+
+    def __iter__(self):
+        try:
+            yield from self.frames
+        finally:
+            self.close()
+
+    def close(self):
+        events.close_stream(self.slot)
+
+
+class _AsyncStreamSlot(_StreamSlot):
+    __iter__ = None  # so StreamingHttpResponse serves it as an async iterator
+
+    async def __aiter__(self):
+        try:
+            async for frame in self.frames:
+                yield frame
+        finally:
+            self.close()
+
+
+def _stream_response(frames):
+    """text/event-stream response over (sync or async) frames, or 503 once this process serves SSE_MAX_STREAMS streams."""
+    slot = events.open_stream()
+    if slot is None:
+        return ratelimit.rejection(503, settings.SSE_RETRY_MS / 1000, "Too many open streams; poll /api/session")
+    content = _AsyncStreamSlot(frames, slot) if hasattr(frames, "__aiter__") else _StreamSlot(frames, slot)
+    response = StreamingHttpResponse(content, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@require_http_methods(["GET"])
+def session_stream(request):
+    """
+    Server-Sent Events alternative to polling GET /api/session. Each open stream holds a worker
+    thread, so at most SSE_MAX_STREAMS run per process (503 beyond that); a stream ends after
+    SSE_MAX_STREAM_SECONDS and the client reconnects with Last-Event-ID, which suppresses the resend
+    of an unchanged payload.
+    """
+    sid = request.GET.get("session_id")
+    if sid:
+        session = MeetingSession.objects.filter(id=sid).first() if sid.isdigit() else None
+    else:
+        session = cache.active_session(open_only=True)
+    if not session:
+        return JsonResponse({"error": "Session not found"}, status=404)
+    return _stream_response(_event_stream(session.pk, request.headers.get("Last-Event-ID")))
 
 
 @require_http_methods(["GET"])
@@ -146,22 +276,216 @@ def session_patch(request):
     session = get_object_or_404(MeetingSession, id=sid)
     if phase not in VALID_TRANSITIONS.get(session.phase, []):
         return JsonResponse({"error": f"Cannot transition from '{session.phase}' to '{phase}'"}, status=400)
+    leaving_voting = session.phase == "voting"
     session.phase = phase
-    session.save()
-    if (phase or "").lower() == "closed":
-        Vote.objects.filter(session=session).delete()
-        Nomination.objects.filter(session=session).delete()
+    with transaction.atomic():
+        session.save(update_fields=["phase", "updated_at"])
+        if (phase or "").lower() == "closed":
+            votequeue.flush(session.pk)
+            archive.close_session(session, keep_results=data.get("archive", settings.RECOGNITION_ARCHIVE_ON_CLOSE))
+            cache.bump_versions(session, "nominations_version", "votes_version")
+    if leaving_voting:
+        votequeue.flush(session.pk)  # ballots queued while voting was open count toward the results
+    events.publish(session.pk)
     return JsonResponse({"session": session_to_dict(session)})
 
 
+SESSIONS_PAGE_SIZE = 50
+
+
+def _session_cursor(cursor):
+    """(updated_at, id) to continue after, or None; ValueError if malformed."""
+    if not cursor:
+        return None
+    updated_at, pk = _decode_cursor(cursor)
+    try:
+        return datetime.fromisoformat(updated_at), pk
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
+@require_http_methods(["GET"])
+@admin_required
+def sessions_list(request):
+    """
+    Admin: sessions, most recently updated first, with nomination / nominator / vote counts, in keyset
+    pages of ?limit= (default SESSIONS_PAGE_SIZE) after ?cursor=; ?phase=a,b filters.
+    """
+    try:
+        limit = _limit_param(request, settings.RECOGNITION_SESSIONS_MAX_PAGE) or SESSIONS_PAGE_SIZE
+        after = _session_cursor(request.GET.get("cursor"))
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+    phases = [p for p in request.GET.get("phase", "").split(",") if p]
+    valid = {value for value, _ in MeetingSession.PHASE_CHOICES}
+    if set(phases) - valid:
+        return JsonResponse({"error": f"phase must be one of: {', '.join(sorted(valid))}"}, status=400)
+    sessions = MeetingSession.objects.order_by("-updated_at", "-id")
+    if phases:
+        sessions = sessions.filter(phase__in=phases)
+    if after:
+        sessions = sessions.filter(Q(updated_at__lt=after[0]) | Q(updated_at=after[0], id__lt=after[1]))
+    page = list(counts.with_counts(sessions)[: limit + 1])
+    next_cursor = _encode_cursor(page[limit - 1].updated_at.isoformat(), page[limit - 1].id) if len(page) > limit else None
+    return JsonResponse({
+        "sessions": [
+            {
+                **session_to_dict(s),
+                "updated_at": s.updated_at.isoformat(),
+                "nomination_count": s.nomination_count,
+                "nominator_count": s.nominator_count,
+                "vote_count": s.vote_count,
+                "none_of_above_count": s.none_of_above_count,
+            }
+            for s in page[:limit]
+        ],
+        "next_cursor": next_cursor,
+    })
+
+
+@require_http_methods(["GET"])
+@admin_required
+def session_export(request, session_id, kind):
+    """
+    Admin: stream the session's nominations, votes or results as ?format=csv (default) or ndjson.
+    Nominations and votes are only there until the session closes; results come from the archive
+    then, or from the history summary (its top nominees) if the session was closed without one.
+    """
+    fmt = request.GET.get("format", "csv")
+    if kind not in ("nominations", "votes", "results"):
+        return JsonResponse({"error": "Unknown export"}, status=404)
+    if fmt not in export.FORMATS:
+        return JsonResponse({"error": f"format must be one of: {', '.join(export.FORMATS)}"}, status=400)
+    session = get_object_or_404(MeetingSession, id=session_id)
+    if kind == "results":
+        if session.phase == "closed":
+            results = archive.archived_results(session) or history.summary_results(session)
+            if results is None:
+                return JsonResponse({"error": "Session was closed without keeping its results"}, status=409)
+        else:
+            results = _get_results_for_session(session)
+        rows = export.result_rows(results)
+    elif session.phase == "closed":
+        return JsonResponse({"error": f"Session is closed; its {kind} were deleted"}, status=409)
+    else:
+        rows = export.nomination_rows(session) if kind == "nominations" else export.vote_rows(session)
+    response = StreamingHttpResponse(export.stream(rows, fmt), content_type=export.FORMATS[fmt])
+    response["Content-Disposition"] = f'attachment; filename="session-{session.pk}-{kind}.{fmt}"'
+    return response
+
+
+@require_http_methods(["GET"])
+def history_view(request):
+    """Closed sessions held between ?from= and ?to= (YYYY-MM-DD, inclusive) with a leaderboard across them."""
+    try:
+        start, end = (date.fromisoformat(request.GET[p]) if request.GET.get(p) else None for p in ("from", "to"))
+    except ValueError:
+        return JsonResponse({"error": "from and to must be dates (YYYY-MM-DD)"}, status=400)
+    return JsonResponse(RawJSON(history.history_payload(start, end)))
+
+
 @require_http_methods(["GET"])
 def nominations_list(request):
-    session = _resolve_session(request)
+    return _nominations_response(request, _resolve_session(request))
+
+
+NOMINATION_ROWS = RowEncoder("id", "nominator_name", "nominee_name", "reason")
+
+
+def _encode_cursor(nominee_key, pk):
+    return base64.urlsafe_b64encode(json.dumps([nominee_key, pk]).encode()).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor):
+    """(sort key, id) of the last row on the previous page; ValueError if malformed."""
+    try:
+        key, pk = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (TypeError, ValueError, binascii.Error):
+        raise ValueError("Invalid cursor")
+    if not isinstance(key, str) or not isinstance(pk, int):
+        raise ValueError("Invalid cursor")
+    return key, pk
+
+
+def _limit_param(request, maximum):
+    """?limit= capped at maximum, None if absent; ValueError if not a positive integer."""
+    limit = request.GET.get("limit")
+    if limit is None:
+        return None
+    if not limit.isdigit() or int(limit) < 1:
+        raise ValueError("limit must be a positive integer")
+    return min(int(limit), maximum)
+
+
+def _nominations_params(request):
+    """(fields, limit, cursor) from ?fields=a,b&limit=n&cursor=c; ValueError with a message if invalid."""
+    fields = NOMINATION_ROWS.fields
+    if request.GET.get("fields"):
+        requested = set(request.GET["fields"].split(","))
+        unknown = requested - set(fields)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        fields = tuple(f for f in fields if f in requested)
+    limit = _limit_param(request, settings.RECOGNITION_NOMINATIONS_MAX_PAGE)
+    cursor = request.GET.get("cursor")
+    if cursor and limit is None:
+        limit = settings.RECOGNITION_NOMINATIONS_MAX_PAGE
+    return fields, limit, _decode_cursor(cursor) if cursor else None
+
+
+def _nominations_response(request, session):
+    """
+    Nominations ordered by nominee. Without limit/cursor: all of them. With them: one keyset page
+    after the cursor's (nominee_key, id) plus next_cursor (null on the last page). fields= projects.
+    """
+    try:
+        fields, limit, cursor = _nominations_params(request)
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+    if not session:
+        return JsonResponse({"nominations": []} if limit is None else {"nominations": [], "next_cursor": None})
+    rows = RowEncoder(*fields)
+
+    def build():  # cached as the encoded body, so a cache hit skips the query and encoding
+        qs = session.nominations.order_by("nominee_key", "id")
+        if cursor:
+            key, pk = cursor
+            qs = qs.filter(Q(nominee_key__gt=key) | Q(nominee_key=key, id__gt=pk))
+        if limit is None:
+            return b'{"nominations": %s}' % rows.encode(qs.values_list(*fields))
+        page = list(qs.values_list(*fields, "nominee_key", "id")[: limit + 1])
+        next_cursor = _encode_cursor(*page[limit - 1][-2:]) if len(page) > limit else None
+        return b'{"nominations": %s, "next_cursor": %s}' % (
+            rows.encode(row[: len(fields)] for row in page[:limit]),
+            json.dumps(next_cursor).encode(),
+        )
+
+    variant = None if (fields, limit, cursor) == (NOMINATION_ROWS.fields, None, None) else repr((fields, limit, cursor))
+    return _conditional(
+        request,
+        _nominations_etag(session),
+        lambda: JsonResponse(RawJSON(cache.cached("nominations", session, build, variant=variant))),
+    )
+
+
+@require_http_methods(["GET"])
+def nominations_grouped(request):
+    return _nominations_grouped_response(request, _resolve_session(request))
+
+
+def _nominations_grouped_response(request, session):
+    """One entry per nominee (see grouping.grouped_nominations); cached and ETagged like the flat list."""
     if not session:
-        return JsonResponse({"nominations": []})
-    qs = session.nominations.all().order_by(Lower("nominee_name"))
-    data = [{"id": n.id, "nominator_name": n.nominator_name, "nominee_name": n.nominee_name, "reason": n.reason} for n in qs]
-    return JsonResponse({"nominations": data})
+        return JsonResponse({"nominees": []})
+
+    def build():
+        return http.dumps({"nominees": grouping.grouped_nominations(session)})
+
+    return _conditional(
+        request,
+        _nominations_etag(session),
+        lambda: JsonResponse(RawJSON(cache.cached("nominations", session, build, variant="grouped"))),
+    )
 
 
 @csrf_exempt
@@ -171,20 +495,33 @@ def nomination_create(request):
     nominator_name, nominee_name, reason = data.get("nominator_name"), data.get("nominee_name"), data.get("reason")
     if not all([nominator_name, nominee_name, reason]):
         return JsonResponse({"error": "Missing fields"}, status=400)
-    session = _resolve_session(request, data.get("session_id"))
+    return _save_nomination(_resolve_session(request, data.get("session_id")), nominator_name, nominee_name, reason)
+
+
+def _save_nomination(session, nominator_name, nominee_name, reason):
     if not session:
         return JsonResponse({"error": "Session not found"}, status=404)
     if session.phase != "nomination":
         return JsonResponse({"error": "Session not in nomination phase"}, status=400)
-    if Nomination.objects.filter(session=session, nominator_name=nominator_name, nominee_name__iexact=nominee_name.strip()).exists():
+    try:
+        created = _insert_nomination(session, nominator_name, nominee_name, reason)
+    except IntegrityError:  # one_nomination_per_nominee_per_nominator
         return JsonResponse({"error": "You can nominate each person at most once."}, status=400)
-    count = Nomination.objects.filter(session=session, nominator_name=nominator_name).count()
-    if count >= 3:
+    if not created:
         return JsonResponse({"error": "You can nominate at most 3 people per session."}, status=400)
-    Nomination.objects.create(session=session, nominator_name=nominator_name, nominee_name=nominee_name, reason=reason)
     return JsonResponse({"ok": True}, status=201)
 
 
+@write_transaction
+def _insert_nomination(session, nominator_name, nominee_name, reason):
+    """Claim a quota slot and insert in one transaction; False when the nominator has no slot left."""
+    if not quota.claim(session, nominator_name):
+        return False
+    Nomination.objects.create(session=session, nominator_name=nominator_name, nominee_name=nominee_name, reason=reason)
+    cache.bump_versions(session, "nominations_version")
+    return True
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def vote_create(request):
@@ -192,25 +529,122 @@ def vote_create(request):
     voter_name, nomination_ids = data.get("voter_name"), data.get("nomination_ids", [])
     if not voter_name:
         return JsonResponse({"error": "Voter name required"}, status=400)
-    session = _resolve_session(request, data.get("session_id"))
+    return _save_vote(_resolve_session(request, data.get("session_id")), voter_name, nomination_ids)
+
+
+def _save_vote(session, voter_name, nomination_ids):
     if not session:
         return JsonResponse({"error": "Session not found"}, status=404)
     if session.phase != "voting":
         return JsonResponse({"error": "Session not in voting phase"}, status=400)
-    if Vote.objects.filter(session=session, voter_name=voter_name).exists():
-        return JsonResponse({"error": "You have already voted"}, status=400)
     if len(nomination_ids) > 3:
         return JsonResponse({"error": "You can select up to 3 candidates."}, status=400)
-    vote = Vote.objects.create(session=session, voter_name=voter_name)
-    if nomination_ids:
-        vote.nominations.set(Nomination.objects.filter(session=session, id__in=nomination_ids))
+    if settings.RECOGNITION_VOTE_QUEUE:
+        return _queue_vote(session, voter_name, nomination_ids)
+    try:
+        _insert_vote(session, voter_name, nomination_ids)
+    except IntegrityError:  # one_vote_per_person_per_session
+        return JsonResponse({"error": "You have already voted"}, status=400)
     return JsonResponse({"ok": True}, status=201)
 
 
+@write_transaction
+def _insert_vote(session, voter_name, nomination_ids):
+    vote = Vote.objects.create(session=session, voter_name=voter_name)
+    nominations = (
+        list(Nomination.objects.filter(session=session, id__in=nomination_ids).only("id", "nominee_key", "nominee_name"))
+        if nomination_ids
+        else []
+    )
+    Through = Vote.nominations.through  # a fresh vote has no links, so skip set()'s read of existing ones
+    Through.objects.bulk_create(Through(vote_id=vote.id, nomination_id=n.id) for n in nominations)
+    tally.record_vote(session, nominations)
+    cache.bump_versions(session, "votes_version")
+
+
+def _queue_vote(session, voter_name, nomination_ids):
+    """Queue mode: 202 with a receipt for /api/votes/status; the vote is recorded by votequeue.flush()."""
+    if not isinstance(nomination_ids, list) or not all(isinstance(nid, int) for nid in nomination_ids):
+        return JsonResponse({"error": "nomination_ids must be a list of ids"}, status=400)
+    try:
+        pending = votequeue.enqueue(session, voter_name, nomination_ids)
+    except IntegrityError:  # one_pending_vote_per_voter_per_session
+        return JsonResponse({"error": "You have already voted"}, status=400)
+    return JsonResponse({"ok": True, "receipt": str(pending.receipt), "status": pending.status}, status=202)
+
+
+@require_http_methods(["GET"])
+def vote_status(request):
+    """Status of a queued vote by ?receipt=: pending, recorded, or rejected (with the error)."""
+    try:
+        pending = votequeue.status(request.GET.get("receipt"))
+    except ValidationError:  # not a UUID
+        pending = None
+    if not pending:
+        return JsonResponse({"error": "Receipt not found"}, status=404)
+    return JsonResponse({"receipt": str(pending.receipt), "status": pending.status, "error": pending.error or None})
+
+
 @csrf_exempt
 @admin_required
 @require_http_methods(["DELETE"])
 def nomination_delete(request, nomination_id):
-    nomination = get_object_or_404(Nomination, id=nomination_id)
-    nomination.delete()
+    nomination = get_object_or_404(Nomination.objects.select_related("session"), id=nomination_id)
+    with transaction.atomic():
+        tally.forget_nomination(nomination.session, nomination)
+        nomination.delete()
+        quota.sync(nomination.session, [nomination.nominator_name])
+        cache.bump_versions(nomination.session, "nominations_version", "votes_version")
+        transaction.on_commit(lambda: events.publish(nomination.session_id))
     return JsonResponse({"ok": True})
+
+
+def _bulk_records(request, field):
+    """(session, records, error_response) for a bulk ingestion body {session_id, <field>: [...]}."""
+    data = json.loads(request.body)
+    records = data.get(field)
+    limit = settings.RECOGNITION_BULK_MAX_RECORDS
+    if not isinstance(records, list) or not records:
+        return None, None, JsonResponse({"error": f"{field} must be a non-empty list"}, status=400)
+    if len(records) > limit:
+        return None, None, JsonResponse({"error": f"At most {limit} records per request"}, status=400)
+    session = _resolve_session(request, data.get("session_id"))
+    if not session:
+        return None, None, JsonResponse({"error": "Session not found"}, status=404)
+    return session, records, None
+
+
+def _bulk_response(created, errors):
+    return JsonResponse({"created": created, "errors": errors}, status=201 if created else 400)
+
+
+@csrf_exempt
+@admin_required
+@require_http_methods(["POST"])
+def votes_bulk(request):
+    """Admin: ingest many votes at once (kiosks, paper ballots); returns per-record errors."""
+    session, records, error = _bulk_records(request, "votes")
+    if error:
+        return error
+    if session.phase != "voting":
+        return JsonResponse({"error": "Session not in voting phase"}, status=400)
+    try:
+        return _bulk_response(*bulk.ingest_votes(session, records))
+    except IntegrityError:  # a voter in the batch voted concurrently through vote_create
+        return JsonResponse({"error": "Conflicting votes were recorded meanwhile; retry the batch"}, status=409)
+
+
+@csrf_exempt
+@admin_required
+@require_http_methods(["POST"])
+def nominations_bulk(request):
+    """Admin: ingest many nominations at once; returns per-record errors."""
+    session, records, error = _bulk_records(request, "nominations")
+    if error:
+        return error
+    if session.phase != "nomination":
+        return JsonResponse({"error": "Session not in nomination phase"}, status=400)
+    try:
+        return _bulk_response(*bulk.ingest_nominations(session, records))
+    except IntegrityError:  # a nominator in the batch nominated concurrently through nomination_create
+        return JsonResponse({"error": "Conflicting nominations were recorded meanwhile; retry the batch"}, status=409)
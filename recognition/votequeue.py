@@ -0,0 +1,121 @@
+"""
+Write-behind vote ingestion (VOTE_QUEUE=true). vote_create stores the ballot as a PendingVote and
+answers 202 with its receipt; flush() turns pending ballots into Votes in batches, one transaction
+per session per batch, so a room voting at once costs a few group commits instead of one
+multi-query write transaction per voter. Flushes run on a per-process background thread
+(RECOGNITION_VOTE_QUEUE_THREAD), from the flush_votes command, when a voter checks a pending
+receipt, and when the session leaves the voting phase.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from . import bulk
+from .models import MeetingSession, Nomination, PendingVote, Vote
+from .retry import write_transaction
+
+logger = logging.getLogger(__name__)
+
+_flush_lock = threading.Lock()  # one flush at a time per process; across processes the database serializes them
+_wakeup = threading.Event()
+_thread = None
+_thread_lock = threading.Lock()
+
+
+@write_transaction
+def _insert(session, voter_name, nomination_ids):
+    return PendingVote.objects.create(session=session, voter_name=voter_name, nomination_ids=nomination_ids)
+
+
+def enqueue(session, voter_name, nomination_ids):
+    """Queue a ballot; returns its PendingVote. IntegrityError if the voter already queued one in this session."""
+    pending = _insert(session, voter_name, list(nomination_ids))
+    _wake()
+    return pending
+
+
+def status(receipt):
+    """The PendingVote for receipt, flushing its session first if it is still pending (read-your-write); None if unknown."""
+    pending = PendingVote.objects.filter(receipt=receipt).first()
+    if pending and pending.status == PendingVote.PENDING:
+        flush(pending.session_id)
+        pending.refresh_from_db()
+    return pending
+
+
+def flush(session_id=None, batch_size=None):
+    """Record pending ballots (of one session, or all) until none are left; returns how many were processed."""
+    batch_size = batch_size or settings.RECOGNITION_VOTE_QUEUE_BATCH
+    done = 0
+    with _flush_lock:
+        while processed := _flush_batch(session_id, batch_size):
+            done += processed
+    return done
+
+
+@write_transaction
+def _flush_batch(session_id, batch_size):
+    pending = PendingVote.objects.select_for_update(skip_locked=True).filter(status=PendingVote.PENDING)
+    if session_id is not None:
+        pending = pending.filter(session_id=session_id)
+    batch = list(pending.order_by("id")[:batch_size])
+    by_session = {}
+    for p in batch:
+        by_session.setdefault(p.session_id, []).append(p)
+    for session in MeetingSession.objects.filter(pk__in=by_session):
+        _record(session, by_session[session.pk])
+    return len(batch)
+
+
+def _record(session, batch):
+    """Insert one session's ballots as Votes (as vote_create would) and mark each recorded or rejected."""
+    if session.phase == "closed":
+        PendingVote.objects.filter(id__in=[p.id for p in batch]).update(status=PendingVote.REJECTED, error="Session closed")
+        return
+    voted = set(
+        Vote.objects.filter(session=session, voter_name__in=[p.voter_name for p in batch]).values_list("voter_name", flat=True)
+    )
+    ids = {nid for p in batch for nid in p.nomination_ids}
+    nominations = Nomination.objects.filter(session=session).only("id", "nominee_key", "nominee_name").in_bulk(ids)
+    ballots, recorded, rejected = [], [], []
+    for p in batch:
+        if p.voter_name in voted:  # voted meanwhile through votes_bulk
+            rejected.append(p.id)
+        else:
+            # unknown or deleted nomination ids are dropped, as vote_create's id__in filter does
+            ballots.append((p.voter_name, [nominations[nid] for nid in dict.fromkeys(p.nomination_ids) if nid in nominations]))
+            recorded.append(p.id)
+    if ballots:
+        bulk.insert_votes(session, ballots)
+        PendingVote.objects.filter(id__in=recorded).update(status=PendingVote.RECORDED)
+    if rejected:
+        PendingVote.objects.filter(id__in=rejected).update(status=PendingVote.REJECTED, error="You have already voted")
+
+
+def _wake():
+    """Nudge this process's flusher thread, starting it on first use."""
+    global _thread
+    if not settings.RECOGNITION_VOTE_QUEUE_THREAD:
+        return
+    with _thread_lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(target=_run, name="vote-queue-flusher", daemon=True)
+            _thread.start()
+    _wakeup.set()
+
+
+def _run():
+    while True:
+        _wakeup.wait()
+        time.sleep(settings.RECOGNITION_VOTE_QUEUE_INTERVAL)  # let the burst build up into one batch
+        _wakeup.clear()
+        try:
+            flush()
+        except Exception:
+            logger.exception("Flushing queued votes failed; retrying")
+            _wakeup.set()
+        finally:
+            close_old_connections()